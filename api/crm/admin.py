@@ -2,6 +2,8 @@
 
 # Django
 from django.contrib import admin
+from django.db import transaction
+from django.utils import timezone
 
 # Models
 from api.crm.models import (InteractionDetail, User, 
@@ -9,6 +11,8 @@ from api.crm.models import (InteractionDetail, User,
                         
 from import_export.admin import ExportActionMixin
 
+from api.crm.ingestion.bulk import reading_months, refresh_periods
+
 @admin.register(ProfileClient)
 class ProfileAdmin(ExportActionMixin,admin.ModelAdmin):
     list_display = ('user', 'title', 'code_dga_site', 'is_monitoring', 'is_prom_flow', 'token_service')
@@ -25,3 +29,23 @@ class UserAdmin(ExportActionMixin,admin.ModelAdmin):
             'total', 'nivel', 'is_send_dga')
     list_filter = ('profile_client',)
     date_hierarchy = 'date_time_medition'
+
+    # Mismo recalculo que la API: agregados, resumen y reportes de los meses tocados.
+    def save_model(self, request, obj, form, change):
+        months = reading_months(InteractionDetail.objects.filter(pk=obj.pk)) if change else set()
+        with transaction.atomic():
+            obj.modified = timezone.now()
+            super().save_model(request, obj, form, change)
+            refresh_periods(months | reading_months([obj]))
+
+    def delete_model(self, request, obj):
+        months = reading_months([obj])
+        with transaction.atomic():
+            super().delete_model(request, obj)
+            refresh_periods(months)
+
+    def delete_queryset(self, request, queryset):
+        months = reading_months(queryset.only('profile_client', 'date_time_medition'))
+        with transaction.atomic():
+            super().delete_queryset(request, queryset)
+            refresh_periods(months)
@@ -0,0 +1,110 @@
+"""Time bucketed aggregates of the readings of one well."""
+
+from datetime import datetime, time, timedelta
+
+from django.db.models import Avg, Count, F, FloatField, Max, Min, Sum
+from django.db.models.functions import Cast, NullIf, TruncHour, TruncWeek
+from django.utils import timezone
+
+from api.crm.models import InteractionDaily, InteractionDetail, InteractionMonthly
+
+
+BUCKETS = ('hour', 'day', 'week', 'month')
+METRICS = ('flow_avg', 'flow_min', 'flow_max', 'nivel_avg', 'volume', 'total_end', 'samples')
+DEFAULT_METRICS = ('flow_avg', 'nivel_avg', 'volume')
+
+
+def ratio(numerator, denominator):
+    return Sum(numerator) / Cast(NullIf(Sum(denominator), 0), FloatField())
+
+
+ROLLUP_AGGREGATES = {
+    'flow_avg': lambda: ratio('flow_sum', 'flow_count'),
+    'flow_min': lambda: Min('flow_min'),
+    'flow_max': lambda: Max('flow_max'),
+    'nivel_avg': lambda: ratio('nivel_sum', 'nivel_count'),
+    'volume': lambda: Sum('volume'),
+    'total_end': lambda: Max('total_end'),
+    'samples': lambda: Sum('samples'),
+}
+
+READING_AGGREGATES = {
+    'flow_avg': lambda: Avg('flow'),
+    'flow_min': lambda: Min('flow'),
+    'flow_max': lambda: Max('flow'),
+    'nivel_avg': lambda: Avg('nivel'),
+    'total_end': lambda: Max('total'),
+    'samples': lambda: Count('id'),
+}
+
+
+def local_bounds(start, end):
+    """Half-open datetime range covering the local dates ``start`` to ``end``."""
+    tz = timezone.get_default_timezone()
+    return (
+        datetime.combine(start, time.min, tzinfo=tz),
+        datetime.combine(end + timedelta(days=1), time.min, tzinfo=tz),
+    )
+
+
+def hourly_aggregates(profile_client_id, start, end, metrics):
+    start_at, end_at = local_bounds(start, end)
+    readings = InteractionDetail.objects.filter(
+        profile_client_id=profile_client_id,
+        date_time_medition__gte=start_at,
+        date_time_medition__lt=end_at,
+    )
+    # El volumen se calcula como diferencia entre totalizadores de horas consecutivas.
+    needed = set(metrics) | ({'total_end'} if 'volume' in metrics else set())
+    rows = list(
+        readings.annotate(period=TruncHour('date_time_medition', tzinfo=timezone.get_default_timezone()))
+        .order_by()
+        .values('period')
+        .annotate(**{metric: READING_AGGREGATES[metric]() for metric in needed if metric != 'volume'})
+        .order_by('period')
+    )
+
+    if 'volume' in metrics:
+        previous = InteractionDetail.objects.filter(
+            profile_client_id=profile_client_id,
+            date_time_medition__lt=start_at,
+            total__isnull=False,
+        ).order_by('-date_time_medition', '-id').values_list('total', flat=True).first()
+        for row in rows:
+            total_end = row['total_end']
+            if total_end is None:
+                row['volume'] = None
+                continue
+            row['volume'] = total_end - (previous if previous is not None else total_end)
+            previous = total_end
+    return rows
+
+
+def rollup_aggregates(profile_client_id, bucket, start, end, metrics):
+    if bucket == 'month':
+        rollups = InteractionMonthly.objects.filter(month__gte=start.replace(day=1), month__lte=end)
+        period = F('month')
+    else:
+        rollups = InteractionDaily.objects.filter(day__gte=start, day__lte=end)
+        period = TruncWeek('day') if bucket == 'week' else F('day')
+
+    return list(
+        rollups.filter(profile_client_id=profile_client_id)
+        .annotate(period=period)
+        .order_by()
+        .values('period')
+        .annotate(**{metric: ROLLUP_AGGREGATES[metric]() for metric in metrics})
+        .order_by('period')
+    )
+
+
+def aggregate_readings(profile_client_id, bucket, start, end, metrics=DEFAULT_METRICS):
+    """One dict per bucket (``period`` and the metrics) between the local dates ``start`` and ``end``."""
+    if bucket == 'hour':
+        rows = hourly_aggregates(profile_client_id, start, end, metrics)
+    else:
+        rows = rollup_aggregates(profile_client_id, bucket, start, end, metrics)
+    return [
+        dict(period=row['period'], **{metric: row[metric] for metric in metrics})
+        for row in rows
+    ]
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 class CrmAppConfig(AppConfig):
     name = 'api.crm'
     verbose_name = 'Crm'
+
+    def ready(self):
+        from api.crm import signals  # noqa: F401
@@ -0,0 +1,70 @@
+"""Token authentication with the token -> user lookup cached."""
+
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.authtoken.models import Token
+
+
+DEFAULTS = {
+    'ALIAS': 'default',
+    'TIMEOUT': 300,
+}
+
+TOKEN_KEY = 'crm:token:{}'
+
+
+def get_token_cache_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'TOKEN_CACHE', {}))
+    return config
+
+
+def get_token_cache():
+    return caches[get_token_cache_settings()['ALIAS']]
+
+
+def token_cache_key(key):
+    # La llave del token no queda en claro en el cache.
+    return TOKEN_KEY.format(hashlib.sha256(key.encode('utf-8')).hexdigest())
+
+
+def forget_tokens(keys):
+    get_token_cache().delete_many([token_cache_key(key) for key in keys])
+
+
+def forget_user_tokens(user):
+    forget_tokens(Token.objects.filter(user=user).values_list('key', flat=True))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """``TokenAuthentication`` that reads ``(user, token)`` of valid tokens from the cache first."""
+
+    def authenticate_credentials(self, key):
+        cache = get_token_cache()
+        cache_key = token_cache_key(key)
+        credentials = cache.get(cache_key)
+        if credentials is None:
+            credentials = super().authenticate_credentials(key)
+            cache.set(cache_key, credentials, get_token_cache_settings()['TIMEOUT'])
+        return credentials
+
+    async def aauthenticate(self, request):
+        """``authenticate`` for plain Django async views."""
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed('Invalid token header.')
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            raise AuthenticationFailed('Invalid token header.')
+        credentials = await get_token_cache().aget(token_cache_key(key))
+        if credentials is None:
+            credentials = await sync_to_async(self.authenticate_credentials)(key)
+        return credentials
@@ -0,0 +1,130 @@
+"""Cache of the latest readings and of the well payloads."""
+
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+from django.utils import timezone
+
+from api.crm.conditional import make_etag
+from api.crm.models import ReadingsVersion
+
+
+DEFAULTS = {
+    'ALIAS': 'default',
+    'GRACE': 120,
+}
+
+LAST_DATA_KEY = 'crm:last_data:{}'
+# La version partia de 1 en el cache; el prefijo nuevo no reutiliza esas entradas.
+PAYLOAD_KEY = 'crm:payloads:{}:{}'
+PAYLOAD_VALIDATORS_KEY = 'crm:payload_validators:{}'
+PAYLOAD_VALIDATORS_TIMEOUT = 60 * 60 * 24
+
+
+def get_cache_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'READINGS_CACHE', {}))
+    return config
+
+
+def get_cache():
+    return caches[get_cache_settings()['ALIAS']]
+
+
+def ingestion_timeout(now=None):
+    """Seconds until the next hourly ingestion run has stored its readings."""
+    now = now or timezone.now()
+    next_run = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    return int((next_run - now).total_seconds()) + get_cache_settings()['GRACE']
+
+
+def get_last_data(profile_client_id, compute):
+    """Serialized latest reading of a well, ``compute()`` on a miss."""
+    cache = get_cache()
+    key = LAST_DATA_KEY.format(profile_client_id)
+    data = cache.get(key)
+    if data is None:
+        data = dict(compute())
+        cache.set(key, data, ingestion_timeout())
+    return data
+
+
+async def aget_last_data(profile_client_id, compute):
+    """``get_last_data`` for async views; ``compute`` is a coroutine function."""
+    cache = get_cache()
+    key = LAST_DATA_KEY.format(profile_client_id)
+    data = await cache.aget(key)
+    if data is None:
+        data = dict(await compute())
+        await cache.aset(key, data, ingestion_timeout())
+    return data
+
+
+async def aget_many_last_data(profile_client_ids, compute):
+    """``{id: latest reading}`` of the wells; ``compute(missing ids)`` is a coroutine function."""
+    cache = get_cache()
+    cached = await cache.aget_many([LAST_DATA_KEY.format(profile_client_id) for profile_client_id in profile_client_ids])
+    items = {profile_client_id: cached.get(LAST_DATA_KEY.format(profile_client_id)) for profile_client_id in profile_client_ids}
+    missing = [profile_client_id for profile_client_id, data in items.items() if data is None]
+    if missing:
+        computed = {profile_client_id: dict(data) for profile_client_id, data in (await compute(missing)).items()}
+        await cache.aset_many(
+            {LAST_DATA_KEY.format(profile_client_id): data for profile_client_id, data in computed.items()},
+            ingestion_timeout(),
+        )
+        items.update(computed)
+    return items
+
+
+def set_last_data(items):
+    """Store ``{profile_client_id: serialized reading}``."""
+    get_cache().set_many(
+        {LAST_DATA_KEY.format(profile_client_id): dict(data) for profile_client_id, data in items.items()},
+        ingestion_timeout(),
+    )
+
+
+def readings_version():
+    version = ReadingsVersion.objects.filter(pk=1).values_list('version', flat=True).first()
+    return version or 1
+
+
+def readings_changed(profile_client_ids=(), payloads=True):
+    """Drop the cached latest readings of the wells and, with ``payloads``, every payload."""
+    cache = get_cache()
+    if profile_client_ids:
+        cache.delete_many([LAST_DATA_KEY.format(profile_client_id) for profile_client_id in profile_client_ids])
+    if not payloads:
+        return
+    if not ReadingsVersion.objects.filter(pk=1).update(version=F('version') + 1):
+        ReadingsVersion.objects.get_or_create(pk=1, defaults={'version': 2})
+
+
+def cached_payload(request, compute):
+    """``{data, etag, last_modified}`` of ``compute()``, cached by URL until the readings change."""
+    cache = get_cache()
+    # Un cache por proceso no ve las invalidaciones de los otros workers: no se guarda nada.
+    if isinstance(cache, LocMemCache):
+        data = compute()
+        etag = make_etag(json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder))
+        return {'etag': etag, 'last_modified': None, 'data': data}
+    url = request.build_absolute_uri()
+    key = PAYLOAD_KEY.format(readings_version(), url)
+    entry = cache.get(key)
+    if entry is None:
+        data = compute()
+        etag = make_etag(json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder))
+        # Last-Modified se mantiene mientras el contenido no cambie.
+        validators_key = PAYLOAD_VALIDATORS_KEY.format(url)
+        validators = cache.get(validators_key)
+        if validators is None or validators['etag'] != etag:
+            validators = {'etag': etag, 'last_modified': timezone.now()}
+            cache.set(validators_key, validators, PAYLOAD_VALIDATORS_TIMEOUT)
+        entry = dict(validators, data=data)
+        cache.set(key, entry, ingestion_timeout())
+    return entry
@@ -0,0 +1,55 @@
+"""Columnar layout of the reading responses (``?layout=columns``)."""
+
+from datetime import date, datetime, time
+
+from django.utils import timezone
+from rest_framework.response import Response
+
+
+LAYOUT_QUERY_PARAM = 'layout'
+COLUMNS_LAYOUT = 'columns'
+# Columnas por defecto: las de los graficos.
+DEFAULT_COLUMNS = ('date_time_medition', 'flow', 'total', 'nivel')
+
+
+def wants_columns(request):
+    return request.query_params.get(LAYOUT_QUERY_PARAM) == COLUMNS_LAYOUT
+
+
+def encode_value(value):
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, date):
+        return int(datetime.combine(value, time.min, tzinfo=timezone.get_default_timezone()).timestamp())
+    return value
+
+
+def to_columns(rows, names, get=getattr):
+    """``{name: [value of each row]}``; ``get(row, name)`` reads a value."""
+    return {name: [encode_value(get(row, name)) for row in rows] for name in names}
+
+
+class ColumnarListMixin:
+    """``list`` with ``?layout=columns`` answers ``results`` as one array per field."""
+
+    def column_names(self):
+        columns = {field.name for field in self.get_queryset().model._meta.concrete_fields}
+        fields = [name for name in self.get_serializer().fields if name in columns]
+        return fields if self.request.query_params.get('fields') else list(DEFAULT_COLUMNS)
+
+    def columnar_data(self, rows):
+        """Columns of ``rows`` (a page or a whole queryset)."""
+        attnames = {field.name: field.attname for field in self.get_queryset().model._meta.concrete_fields}
+        return to_columns(rows, self.column_names(), get=lambda row, name: getattr(row, attnames[name]))
+
+    def list(self, request, *args, **kwargs):
+        if not wants_columns(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset()).only(
+            *self.column_names(), *getattr(self, 'sparse_required_fields', ())
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.columnar_data(page))
+        return Response(self.columnar_data(queryset))
@@ -0,0 +1,63 @@
+"""HTTP conditional requests (ETag / Last-Modified) for the read endpoints."""
+
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    return quote_etag(hashlib.md5('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest())
+
+
+def queryset_validators(queryset, *parts):
+    """ETag and Last-Modified of a queryset from its newest row and ``parts``."""
+    # crm_interaction_latest_idx; ediciones y borrados de filas antiguas cambian la version en parts.
+    newest = queryset.order_by('-created', '-modified').values_list('created', 'modified')[:1]
+    created, modified = next(iter(newest), (None, None))
+    last_modified = max((value for value in (created, modified) if value is not None), default=None)
+    etag = make_etag(created, modified, *parts)
+    return etag, last_modified
+
+
+class ConditionalResponseMixin:
+    """Answer ``If-None-Match``/``If-Modified-Since`` with 304 before serializing."""
+
+    def conditional_response(self, request, etag, last_modified, respond):
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request._request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = respond()
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+        patch_vary_headers(response, ['Accept'])
+        return response
+
+
+class ConditionalQuerysetMixin(ConditionalResponseMixin):
+    """ETag/Last-Modified of ``list``/``retrieve`` from the filtered queryset."""
+
+    def get_validators(self, queryset):
+        # api.crm.cache importa este modulo.
+        from api.crm.cache import readings_version
+        return queryset_validators(queryset, readings_version(), self.request.accepted_renderer.format)
+
+    def list(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators(self.filter_queryset(self.get_queryset()))
+        return self.conditional_response(
+            request, etag, last_modified, lambda: super(ConditionalQuerysetMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        etag, last_modified = self.get_validators(queryset)
+        if last_modified is None:
+            # Sin filas: responde el 404 de siempre.
+            return super().retrieve(request, *args, **kwargs)
+        return self.conditional_response(
+            request, etag, last_modified, lambda: super(ConditionalQuerysetMixin, self).retrieve(request, *args, **kwargs)
+        )
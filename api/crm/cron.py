@@ -1,101 +1,129 @@
 from django.db.models import Count
-from .models import (InteractionDetail, ProfileClient)
-from .serializers import InteractionDetailModelSerializer, CronProfileClientSerializer 
-import requests
+from .serializers import CronProfileClientSerializer, InteractionDetailSerializer
+from .ingestion.poller import Poller
+from .ingestion.persistence import ReadingBatch
+from .ingestion.rollups import apply_readings
+from .cache import readings_changed, set_last_data
+from .summaries import refresh_summaries
+from .ingestion.providers import PROVIDERS, get_provider
+from .ingestion.wells import load_wells
 from datetime import datetime
 import pytz
 
 
-def get_novus_and_save_in_api():
-    clients = ProfileClient.objects.filter(is_monitoring=True)
-    chile = pytz.timezone("America/Santiago")
+def parser_total(total, scale):
+    """fx = (Delta Acumulado * P/LT) / 1000"""
+    factor_total_scale = int(total) * int(scale)
+    divide = int(factor_total_scale/1000)
+    return divide
+
+
+def variable_token(client_serializer, variable):
+    if variable['is_other_token']:
+        return variable['token_service']
+    return client_serializer['token_service']
+
+
+def build_response(client_serializer, values, date_time_medition, last_reading=None):
+    """Arma la lectura de un pozo a partir de {id variable: valor}."""
+    provider = get_provider(client_serializer)
+    response = {}
+    response["date_time_medition"] = date_time_medition
+    response["profile_client"] = client_serializer['id']
+
+    for variable in client_serializer['variables']:
+        value = values.get(variable['id'])
+        if value is None:
+            raise ValueError('Sin datos de la variable {}'.format(variable['str_variable']))
+
+        if variable['type_variable'] == "ACUMULADO":
+            response["total"] = parser_total(value, client_serializer['scale']) if value else 0
 
-    def parser_total(total, scale):
-        """fx = (Delta Acumulado * P/LT) / 1000"""
-        factor_total_scale = int(total) * int(scale)
-        divide = int(factor_total_scale/1000)
-        return divide
+        if variable['type_variable'] == "NIVEL":
+            response["nivel"] = provider.round(value) if value else 0.0
 
+        if variable['type_variable'] == "CAUDAL":
+            response["flow"] = provider.round(value) if value else 0.0
+
+    if client_serializer['is_prom_flow']:
+        last_total = 0
+        if last_reading is not None and last_reading.total is not None:
+            last_total = last_reading.total
+
+        sustraction = response['total'] - last_total
+        prom_flow = float(sustraction / 3600)
+        factor_to_mt = float(prom_flow*1000)
+        response['flow'] = round(factor_to_mt, 1)
+
+    return response
+
+
+def get_novus_and_save_in_api():
+    clients = load_wells(is_monitoring=True)
+    chile = pytz.timezone("America/Santiago")
+    date_time_medition = datetime.now(chile).replace(minute=0, second=0, microsecond=0)
 
-    for client in clients:
-        response = {}
-        client_serializer = CronProfileClientSerializer(client).data
-        response["date_time_medition"] = datetime.now(chile).strftime("%Y-%m-%dT%H:00:00")
-        response["profile_client"] = client_serializer['id']
+    clients_serializer = [CronProfileClientSerializer(client).data for client in clients]
 
+    # Las variables que comparten proveedor y token se piden en una sola consulta.
+    groups = {}
+    for client_serializer in clients_serializer:
+        provider = get_provider(client_serializer)
         for variable in client_serializer['variables']:
-            token = client_serializer['token_service']
-
-            if variable['is_other_token']:
-                token = variable['token_service']
-
-            parsed_url = ''
-
-            if client_serializer['is_thethings']:
-                parsed_url = (
-                    f"https://api.thethings.io/v2/things/{token}/resources/{variable['str_variable']}/?limit=1"
-                )
-                request = requests.get(parsed_url)
-            else:
-                parsed_url = (
-                    f"https://api.tago.io/data/?variable={variable['str_variable']}&query=last_item"
-                )
-                request = requests.get(parsed_url, headers={"authorization": token})
-
-
-            data = request.json()
-
-            if variable['type_variable'] == "ACUMULADO":
-                if client_serializer['is_thethings']:
-                    if data[0].get("value"):
-                        response["total"] = parser_total(data[0].get("value"), client_serializer['scale'])
-                    else:
-                        response["total"] = "0"
-                else:
-                    if data.get("result"):
-                        response["total"] = parser_total(data.get("result")[0].get("value"), client_serializer['scale'])
-                    else:
-                        response["total"] = "0"
-
-            if variable['type_variable'] == "NIVEL":
-                if client_serializer['is_thethings']:
-                    if data[0].get("value"):
-                        response["nivel"] = round(data[0].get("value"), 1)
-                    else:
-                        response["total"] = "0"
-                else:
-                    if data.get("result"):
-                        response["nivel"] = data.get("result")[0].get("value")
-                    else:
-                        response["nivel"] = "0.0"
-                
-            if variable['type_variable'] == "CAUDAL":
-                if client_serializer['is_thethings']:
-                    if data[0].get("value"):
-                        response["flow"] = round(data[0].get("value"), 1)
-                    else:
-                        response["flow"] = "0.0"
-                else:
-                    if data.get("result"):
-                        response["flow"] = data.get("result")[0].get("value")
-                    else:
-                        response["flow"] = "0.0"
-
-        if client_serializer['is_prom_flow']:
-            get_last_data = InteractionDetail.objects.filter(profile_client=client_serializer['id']).first()
-
-            last_total = 0
-            if get_last_data is not None:
-                last_total = get_last_data.total
-                
-            sustraction = int(response['total'])-int(last_total)
-            prom_flow = float(sustraction / 3600)
-            factor_to_mt = float(prom_flow*1000)
-            response['flow'] = round(factor_to_mt, 1)
-
-        serializer = InteractionDetailModelSerializer(data=response)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+            variables = groups.setdefault((provider.name, variable_token(client_serializer, variable)), [])
+            if variable['str_variable'] not in variables:
+                variables.append(variable['str_variable'])
+
+    keys = list(groups)
+    requests = [PROVIDERS[name].build_request(token, groups[(name, token)]) for name, token in keys]
+
+    parsed = {}
+    for key, data in zip(keys, Poller().fetch_all(requests)):
+        try:
+            if isinstance(data, Exception):
+                raise data
+            parsed[key] = PROVIDERS[key[0]].parse(data, groups[key])
+        except Exception as e:
+            parsed[key] = e
+
+    # Variables ausentes de la respuesta agrupada: se piden una por una.
+    missing = [
+        (key, variable) for key, values in parsed.items() if not isinstance(values, Exception)
+        for variable, value in values.items() if value is None
+        and PROVIDERS[key[0]].build_variable_request(key[1], variable) is not None
+    ]
+    requests = [PROVIDERS[key[0]].build_variable_request(key[1], variable) for key, variable in missing]
+    for (key, variable), data in zip(missing, Poller().fetch_all(requests)):
+        if not isinstance(data, Exception):
+            parsed[key][variable] = PROVIDERS[key[0]].parse(data, [variable])[variable]
+
+    batch = ReadingBatch()
+    for client, client_serializer in zip(clients, clients_serializer):
+        provider = get_provider(client_serializer)
+        try:
+            values = {}
+            for variable in client_serializer['variables']:
+                group_values = parsed[(provider.name, variable_token(client_serializer, variable))]
+                if isinstance(group_values, Exception):
+                    raise group_values
+                values[variable['id']] = group_values[variable['str_variable']]
+
+            batch.add(build_response(client_serializer, values, date_time_medition, client.last_reading))
+        except Exception as e:
+            batch.fail(client_serializer['id'], e)
+
+    report = batch.save()
+    apply_readings(batch.inserted, {
+        client.id: client.last_reading.total for client in clients if client.last_reading is not None
+    })
+    refresh_summaries({reading.profile_client_id for reading in batch.inserted})
+    # Las lecturas recien guardadas pasan a ser las ultimas de cada pozo.
+    readings_changed()
+    set_last_data({reading.profile_client_id: InteractionDetailSerializer(reading).data for reading in batch.inserted})
+    for profile_client, error in report.errors:
+        print(profile_client, error)
+    print(date_time_medition.strftime("%Y-%m-%dT%H:00:00"), report)
+    return report
 
 
 def main():
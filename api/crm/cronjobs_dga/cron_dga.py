@@ -1,27 +1,29 @@
 from django.db.models import Count
-from ..models import (InteractionDetail, ProfileClient)
+from ..ingestion.wells import load_wells
 from datetime import datetime
 import pytz
-from .send_data_dga import send
+from .send_data_dga import Submitter
 
 def get_novus_and_send_api():
-    clients = ProfileClient.objects.filter(standard='MAYOR', is_send_dga=True)
+    clients = load_wells(standard='MAYOR', is_send_dga=True)
     chile = pytz.timezone("America/Santiago")
     print('Estandar mayor')
 
-    if(clients.count() > 0):
+    if(len(clients) > 0):
+        submissions = []
         for client in clients:
             try:
-                get_data = InteractionDetail.objects.filter(profile_client=client.id).first()
+                get_data = client.last_reading
                 response = {}
                 response["date_time_medition"] = datetime.now(chile).strftime("%Y-%m-%dT%H:00:00")
                 response["total"] = get_data.total
                 response["flow"] = get_data.flow
                 response["nivel"] = get_data.nivel
                 response['id_data'] = get_data.id
-                send(client, response)
+                submissions.append((client, response))
             except Exception as e:
                 print(e)
+        Submitter().send_all(submissions)
     else:
         print('NO HAY CLIENTES CON SERVICIO DGA ESTANDAR MAYOR')
 
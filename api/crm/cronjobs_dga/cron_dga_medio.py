@@ -1,37 +1,34 @@
-from ..models import (InteractionDetail, ProfileClient)
-from datetime import datetime
-from ..serializers import InteractionDetailModelSerializer
+from ..filters import hour_range
+from ..ingestion.wells import load_wells
+from datetime import datetime, timedelta
 import pytz
-from .send_data_dga import send
+from .send_data_dga import Submitter
 
 
 def get_novus_and_send_api():
-    clients = ProfileClient.objects.filter(standard='MEDIO', is_send_dga=True)
     chile = pytz.timezone("America/Santiago")
-    day = datetime.now(chile).strftime("%d")
-    month = datetime.now(chile).strftime("%m")
-    year = datetime.now(chile).strftime("%Y")
-    hour = datetime.now(chile).strftime("%H")
+    now = datetime.now(chile)
+    # Lectura de la misma hora del dia anterior.
+    clients = load_wells(
+        reference=hour_range(now.date() - timedelta(days=1), now.hour),
+        standard='MEDIO',
+        is_send_dga=True
+    )
 
-    if (clients.count() > 0):
+    if (len(clients) > 0):
+        submissions = []
         for client in clients:
             try:
-                get_data = InteractionDetail.objects.filter(profile_client=client.id).first()
+                get_data = client.last_reading
                 response = {}
                 if client.is_prom_flow:
-                    get_data_old = InteractionDetail.objects.filter(
-                        profile_client=client.id,
-                        date_time_medition__year=year,
-                        date_time_medition__month=month,
-                        date_time_medition__day=int(day) - 1,
-                        date_time_medition__hour=hour
-                    ).first()
+                    get_data_old = client.reference_reading
                     last_total = 0
                     if get_data_old is not None:
-                        last_total = int(InteractionDetailModelSerializer(get_data_old).data['total'])
+                        last_total = get_data_old.total or 0
 
                     total_old = last_total
-                    sustraction = int(get_data.total) - total_old
+                    sustraction = get_data.total - total_old
                     prom_flow = float(sustraction / 86400)
                     factor_to_mt = float(prom_flow*1000)
                     response["flow"] = round(factor_to_mt, 1)
@@ -42,9 +39,10 @@ def get_novus_and_send_api():
                 response["total"] = get_data.total
                 response["nivel"] = get_data.nivel
                 response['id_data'] = get_data.id
-                send(client, response)
+                submissions.append((client, response))
             except Exception as e:
                 print(e)
+        Submitter().send_all(submissions)
     else:
         print('NO HAY CLIENTES CON SERVICIO DGA ESTANDAR MEDIO')
 
@@ -1,37 +1,34 @@
 from django.db.models import Count
-from ..models import (InteractionDetail, ProfileClient)
-from ..serializers import InteractionDetailModelSerializer
+from ..filters import hour_range, same_day_in
+from ..ingestion.wells import load_wells
 from datetime import datetime
 import pytz
-from .send_data_dga import send
+from .send_data_dga import Submitter
 
 def get_novus_and_send_api():
-    clients = ProfileClient.objects.filter(standard='CAUDALES_MUY_PEQUENOS', is_send_dga=True)
     chile = pytz.timezone("America/Santiago")
-    day = datetime.now(chile).strftime("%d")
-    month = datetime.now(chile).strftime("%m")
-    year = datetime.now(chile).strftime("%Y")
-    hour = datetime.now(chile).strftime("%H")
+    now = datetime.now(chile)
+    # Lectura de la misma hora y dia del año anterior.
+    clients = load_wells(
+        reference=hour_range(same_day_in(now.year - 1, now.month, now.day), now.hour),
+        standard='CAUDALES_MUY_PEQUENOS',
+        is_send_dga=True
+    )
 
-    if(clients.count() > 0):
+    if(len(clients) > 0):
+        submissions = []
         for client in clients:
             try:
-                get_data = InteractionDetail.objects.filter(profile_client=client.id).first()
+                get_data = client.last_reading
                 response = {}
                 if client.is_prom_flow:
-                    get_data_old = InteractionDetail.objects.filter(
-                        profile_client=client.id,
-                        date_time_medition__year=int(year)-1,
-                        date_time_medition__month=month,
-                        date_time_medition__day=day,
-                        date_time_medition__hour=hour
-                    ).first()
+                    get_data_old = client.reference_reading
                     last_total = 0
                     if get_data_old is not None:
-                        last_total = int(InteractionDetailModelSerializer(get_data_old).data['total'])
+                        last_total = get_data_old.total or 0
 
                     total_old = last_total
-                    sustraction = int(get_data.total) - total_old
+                    sustraction = get_data.total - total_old
                     prom_flow = float(sustraction / 31536000)
                     factor_to_mt = float(prom_flow*1000)
                     response["flow"] = round(factor_to_mt, 1)
@@ -41,9 +38,10 @@ def get_novus_and_send_api():
                 response["total"] = get_data.total
                 response["nivel"] = get_data.nivel
                 response['id_data'] = get_data.id
-                send(client, response)
+                submissions.append((client, response))
             except Exception as e:
                 print(e)
+        Submitter().send_all(submissions)
     else:
         print('NO HAY CLIENTES CON SERVICIO DGA ESTANDAR CAUDALES MUY PEQUENOS')
 
@@ -1,31 +1,45 @@
+"""Submission of the readings to the DGA SOAP service (snia.mop.gob.cl)."""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from zeep import Client
 import requests
+from requests.adapters import HTTPAdapter
 import xml.etree.ElementTree as ET
+from django.conf import settings
+from django.utils import timezone
 from ..models import InteractionDetail
+from ..cache import readings_changed
+from ..summaries import record_dga_result
 
 
-def send(profile_data, response):
+DEFAULTS = {
+    'URL': 'https://snia.mop.gob.cl/controlextraccion/datosExtraccion/SendDataExtraccionService',
+    'CONCURRENCY': 8,
+    'CONNECT_TIMEOUT': 10,
+    'READ_TIMEOUT': 60,
+}
 
-    def convertir_a_int(cadena):
-        try:
-            return int(cadena) 
-        except ValueError:
-            try:
-                return int(float(cadena)) 
-            except ValueError:
-                return int(0)
+RESPONSE_NS = '{http://www.mop.cl/controlextraccion/xsd/datosExtraccion/AuthSendDataExtraccionResponse}'
+
+
+def get_dga_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'DGA_SUBMISSION', {}))
+    return config
 
-    url = "https://snia.mop.gob.cl/controlextraccion/datosExtraccion/SendDataExtraccionService"
+
+def build_payload(profile_data, response):
+    """SOAP envelope of one reading of the well."""
     codigo_obra= profile_data.code_dga_site
     time_stamp_origen=response['date_time_medition']+'Z'
     fecha_medicion=str(response['date_time_medition'][8:10]+'-'+response['date_time_medition'][5:7]+'-'+response['date_time_medition'][0:4])
     hora_medicion=str(response['date_time_medition'][11:19])
-    totalizador=convertir_a_int(response['total'])
+    totalizador=int(response['total'])
     caudal=float(response['flow'])
     nivel_freatico_del_pozo=round(float(profile_data.d3)-float(response['nivel']),1)
     rut = profile_data.rut_report_dga
     password = profile_data.password_dga_software
-    id_interaction = response['id_data']
 
 
 
@@ -46,21 +60,88 @@ def send(profile_data, response):
             fecha_medicion=fecha_medicion,
             hora_medicion=hora_medicion)
 
+    return payload
+
+
+def parse_response(text):
+    """``(is_send, description)`` of the answer of the DGA."""
+    root = ET.fromstring(text)
+    description = root.find('.//' + RESPONSE_NS + 'Description')
+    code = root.find('.//' + RESPONSE_NS + 'Code')
+    description_parser = ('{code}) {description}').format(code=code.text, description=description.text)
+    return code.text == '0', description_parser
+
+
+def save_result(profile_data, id_interaction, is_send, description):
+    InteractionDetail.objects.filter(id=id_interaction).update(
+        soap_return=description, is_send_dga=is_send, modified=timezone.now()
+    )
+    record_dga_result(profile_data.id, is_send, description)
+
+
+class Submitter:
+    """Post many submissions to the DGA with at most ``concurrency`` in flight."""
+
     headers = {
-      'Content-Type': 'application/xml'
+        'Content-Type': 'application/xml'
     }
 
+    def __init__(self, concurrency=None, timeout=None):
+        config = get_dga_settings()
+        self.url = config['URL']
+        self.concurrency = concurrency or config['CONCURRENCY']
+        self.timeout = timeout or (config['CONNECT_TIMEOUT'], config['READ_TIMEOUT'])
 
-    response = requests.request("POST", url, headers=headers, data=payload)
-    
-    root = ET.fromstring(response.text)
-    description = root.find('.//{http://www.mop.cl/controlextraccion/xsd/datosExtraccion/AuthSendDataExtraccionResponse}Description')
-    code = root.find('.//{http://www.mop.cl/controlextraccion/xsd/datosExtraccion/AuthSendDataExtraccionResponse}Code')
-    
-    is_send = False
+    def session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
 
-    if code.text == '0':
-        is_send=True
+    def post(self, session, payload):
+        response = session.post(self.url, headers=self.headers, data=payload, timeout=self.timeout)
+        return parse_response(response.text)
 
-    description_parser = ('{code}) {description}').format(code=code.text, description=description.text)
-    InteractionDetail.objects.filter(id=id_interaction).update(soap_return=description_parser, is_send_dga=is_send)
+    def send_all(self, submissions):
+        """Send ``[(profile_data, response)]``, save each result and return the readings accepted."""
+        payloads = []
+        for profile_data, response in submissions:
+            try:
+                payloads.append((profile_data, response['id_data'], build_payload(profile_data, response)))
+            except Exception as e:
+                print(profile_data, e)
+        if not payloads:
+            return 0
+
+        sent = 0
+        wells = set()
+        with self.session() as session, ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = {
+                pool.submit(self.post, session, payload): (profile_data, id_interaction)
+                for profile_data, id_interaction, payload in payloads
+            }
+            # La base de datos se actualiza solo en este hilo.
+            for future in as_completed(futures):
+                profile_data, id_interaction = futures[future]
+                try:
+                    is_send, description = future.result()
+                except Exception as e:
+                    print(profile_data, e)
+                    continue
+                save_result(profile_data, id_interaction, is_send, description)
+                wells.add(profile_data.id)
+                sent += is_send
+        if wells:
+            readings_changed(wells)
+        return sent
+
+
+def send(profile_data, response):
+    """Send one reading; raises when the DGA can not be reached."""
+    submitter = Submitter(concurrency=1)
+    payload = build_payload(profile_data, response)
+    with submitter.session() as session:
+        is_send, description = submitter.post(session, payload)
+    save_result(profile_data, response['id_data'], is_send, description)
+    readings_changed([profile_data.id])
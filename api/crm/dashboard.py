@@ -0,0 +1,84 @@
+"""Summary of every well of a user, with a fixed number of queries."""
+
+from django.db.models import Count
+from django.utils import timezone
+
+from api.crm.models import InteractionDaily, InteractionDetail, InteractionMonthly
+from api.crm.partitions import month_start
+from api.crm.serializers.client_profile import InteractionDetailSerializer
+
+
+def rollup_summary(rollup):
+    if rollup is None:
+        return None
+    return {
+        'volume': rollup.volume,
+        'flow_avg': rollup.flow_avg,
+        'nivel_avg': rollup.nivel_avg,
+        'samples': rollup.samples,
+    }
+
+
+DASHBOARD_FIELDS = ('id', 'title', 'code_dga_site', 'is_dga', 'is_send_dga')
+
+
+def dashboard_querysets(wells, today):
+    """Daily and monthly rollups and the DGA pending counts of the loaded ``wells``."""
+    ids = [well.id for well in wells]
+    month = today.replace(day=1)
+    daily = InteractionDaily.objects.filter(profile_client_id__in=ids, day=today)
+    monthly = InteractionMonthly.objects.filter(profile_client_id__in=ids, month=month)
+    pending = InteractionDetail.objects.filter(
+        profile_client_id__in=[well.id for well in wells if well.is_dga],
+        date_time_medition__gte=month_start(month.year, month.month),
+        is_send_dga=False,
+    ).order_by().values('profile_client_id').annotate(count=Count('pk')).values_list('profile_client_id', 'count')
+    return daily, monthly, pending
+
+
+def build_dashboard(wells, today, latest, daily, monthly, pending):
+    latest = {reading.profile_client_id: reading for reading in latest}
+    daily = {rollup.profile_client_id: rollup for rollup in daily}
+    monthly = {rollup.profile_client_id: rollup for rollup in monthly}
+    pending = dict(pending)
+
+    results = []
+    for well in wells:
+        reading = latest.get(well.id)
+        results.append({
+            'id': well.id,
+            'title': well.title,
+            'code_dga_site': well.code_dga_site,
+            'last_data': InteractionDetailSerializer(reading).data if reading else None,
+            'today': rollup_summary(daily.get(well.id)),
+            'month': rollup_summary(monthly.get(well.id)),
+            'dga': {
+                'enabled': well.is_dga,
+                'is_send_dga': well.is_send_dga,
+                'last_sent': reading.is_send_dga if reading else None,
+                'last_response': reading.soap_return if reading else None,
+                'pending_month': pending.get(well.id, 0) if well.is_dga else None,
+            },
+        })
+    return {'date': today, 'wells': results}
+
+
+def well_dashboard(wells):
+    """Latest reading, today's and this month's rollup and DGA status of ``wells``, in constant queries."""
+    wells = list(wells.only(*DASHBOARD_FIELDS))
+    today = timezone.localdate()
+    latest = InteractionDetail.objects.latest_per_well([well.id for well in wells])
+    daily, monthly, pending = dashboard_querysets(wells, today)
+    return build_dashboard(wells, today, latest, list(daily), list(monthly), list(pending))
+
+
+async def awell_dashboard(wells):
+    """``well_dashboard`` for async views, same queries."""
+    wells = [well async for well in wells.only(*DASHBOARD_FIELDS)]
+    today = timezone.localdate()
+    latest = await InteractionDetail.objects.alatest_per_well([well.id for well in wells])
+    daily, monthly, pending = dashboard_querysets(wells, today)
+    return build_dashboard(
+        wells, today, latest,
+        [rollup async for rollup in daily], [rollup async for rollup in monthly], [row async for row in pending],
+    )
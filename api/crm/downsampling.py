@@ -0,0 +1,130 @@
+"""Downsampling of time series for charts (``?max_points=``)."""
+
+from datetime import date, datetime
+
+import numpy as np
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from api.crm.columnar import wants_columns
+
+
+# lttb conserva la forma; minmax el minimo y maximo de cada tramo, sin perder picos.
+METHODS = ('lttb', 'minmax')
+MAX_POINTS = 10000
+
+
+def lttb(x, y, threshold):
+    """Indices of the ``threshold`` points LTTB keeps from ``(x, y)``."""
+    size = len(x)
+    if threshold >= size or threshold < 3:
+        return np.arange(size)
+
+    # threshold - 2 buckets entre el primer y el ultimo punto.
+    edges = np.linspace(1, size - 1, threshold - 1).astype(int)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, size - 1
+    a = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        area = np.abs(
+            (x[a] - next_x[bucket]) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (next_y[bucket] - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[bucket + 1] = a
+    return selected
+
+
+def minmax(x, y, threshold):
+    """Indices of the minimum and maximum of ``threshold // 2`` buckets."""
+    size = len(x)
+    buckets = threshold // 2
+    if threshold >= size or buckets < 1:
+        return np.arange(size)
+    edges = np.linspace(0, size, buckets + 1).astype(int)
+    selected = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        selected.append(start + int(np.argmin(y[start:end])))
+        selected.append(start + int(np.argmax(y[start:end])))
+    return np.unique(selected)
+
+
+def to_number(value):
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, date):
+        return value.toordinal() * 86400.0
+    return value
+
+
+def downsample(x, series, max_points, method='lttb'):
+    """Sorted positions to keep, first and last included, sharing ``max_points`` among ``series``."""
+    select = lttb if method == 'lttb' else minmax
+    x = np.asarray([to_number(value) for value in x], dtype=float)
+    if len(x) <= max_points:
+        return np.arange(len(x))
+    share = max(3, max_points // max(1, len(series)))
+    selected = [np.array([0, len(x) - 1])]
+    for values in series:
+        y = np.asarray([np.nan if value is None else value for value in values], dtype=float)
+        present = np.flatnonzero(~np.isnan(y))
+        if len(present):
+            selected.append(present[select(x[present], y[present], share)])
+    return np.unique(np.concatenate(selected))
+
+
+def downsample_rows(rows, x, names, max_points, method='lttb', get=getattr):
+    """The rows of ``rows`` (sorted by ``x``) kept for ``names``."""
+    keep = downsample(
+        [get(row, x) for row in rows],
+        [[get(row, name) for row in rows] for name in names],
+        max_points, method,
+    )
+    return [rows[position] for position in keep]
+
+
+class DownsampleSerializer(serializers.Serializer):
+    """Query params ``max_points`` and ``downsample`` (method)."""
+
+    max_points = serializers.IntegerField(min_value=3, max_value=MAX_POINTS)
+    downsample = serializers.ChoiceField(choices=METHODS, default='lttb')
+
+
+class DownsampleListMixin:
+    """``list`` with ``?max_points=N`` returns at most about N points of one well, oldest first."""
+
+    downsample_x = 'date_time_medition'
+    downsample_y = ('flow', 'total', 'nivel')
+    downsample_well_param = 'profile_client'
+
+    def list(self, request, *args, **kwargs):
+        if 'max_points' not in request.query_params:
+            return super().list(request, *args, **kwargs)
+        params = DownsampleSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        if not request.query_params.get(self.downsample_well_param):
+            raise ValidationError({self.downsample_well_param: ['Requerido con max_points.']})
+
+        queryset = self.filter_queryset(self.get_queryset())
+        # Solo las columnas del grafico; las filas elegidas se leen completas despues.
+        rows = list(queryset.order_by(self.downsample_x, 'pk').values('pk', self.downsample_x, *self.downsample_y))
+        kept = downsample_rows(
+            rows, self.downsample_x, self.downsample_y,
+            params.validated_data['max_points'], params.validated_data['downsample'],
+            get=lambda row, name: row[name],
+        )
+        selected = queryset.filter(pk__in=[row['pk'] for row in kept]).order_by(self.downsample_x, 'pk')
+
+        if wants_columns(request) and hasattr(self, 'columnar_data'):
+            data = self.columnar_data(selected)
+        else:
+            data = self.get_serializer(selected, many=True).data
+        return Response({'count': len(rows), 'results': data})
@@ -0,0 +1,146 @@
+"""Filters of the readings on measurement time that can use the indexes."""
+
+import calendar
+from datetime import date, datetime, timedelta
+
+import pytz
+from django.conf import settings
+from django_filters import rest_framework as filters
+from rest_framework.exceptions import ValidationError
+
+from api.crm.partitions import add_months
+
+
+MEASUREMENT_FIELD = 'date_time_medition'
+
+# year/month/day/date se convierten en rangos [inicio, fin) en hora local: sin EXTRACT, usan los indices.
+MEASUREMENT_LOOKUPS = [
+    'gte', 'lte', 'gt', 'lt', 'year', 'month', 'day', 'date',
+    'year__range', 'month__range', 'day__range', 'date__range',
+]
+
+# Lookups de los clientes antiguos sobre created, aplicados a date_time_medition.
+LEGACY_LOOKUPS = [
+    'contains', 'gte', 'lte', 'year', 'month', 'day',
+    'year__range', 'month__range', 'day__range', 'date__range',
+]
+
+CALENDAR_PARTS = ('year', 'month', 'day')
+
+
+def local_datetime(year, month=1, day=1, hour=0):
+    # Chile cambia de horario a medianoche: is_dst=False da el instante del cambio.
+    return pytz.timezone(settings.TIME_ZONE).localize(datetime(year, month, day, hour), is_dst=False)
+
+
+def hour_range(day, hour):
+    """Lookups of the readings measured in one local ``hour`` of ``day``."""
+    start = local_datetime(day.year, day.month, day.day, hour)
+    return {MEASUREMENT_FIELD + '__gte': start, MEASUREMENT_FIELD + '__lt': start + timedelta(hours=1)}
+
+
+def same_day_in(year, month, day):
+    """``date(year, month, day)``, the last day of the month when it is shorter."""
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def calendar_range(bounds):
+    """Half-open range of the ``(first, last)`` ``bounds`` per part, and the parts it cannot express."""
+    # year=2023&month=5 es un rango; month=5 solo queda como lookup.
+    first, last, rest = [], [], {}
+    narrowing = True
+    for part in CALENDAR_PARTS:
+        if part not in bounds:
+            narrowing = False
+        elif narrowing:
+            first.append(bounds[part][0])
+            last.append(bounds[part][1])
+            narrowing = bounds[part][0] == bounds[part][1]
+        else:
+            rest[part] = bounds[part]
+    if not first:
+        return None, rest
+
+    start = local_datetime(*first)
+    if len(last) == 1:
+        end = local_datetime(last[0] + 1)
+    elif len(last) == 2:
+        end = local_datetime(*add_months(last[0], last[1], 1))
+    else:
+        following = date(*last) + timedelta(days=1)
+        end = local_datetime(following.year, following.month, following.day)
+    return (start, end), rest
+
+
+def measurement_lookups(values):
+    """Lookups on ``date_time_medition`` for the cleaned date filters; raises ``ValueError`` or ``OverflowError``."""
+    lookups = {}
+    for lookup in ('gte', 'lte', 'gt', 'lt'):
+        if lookup in values:
+            lookups[lookup] = values[lookup]
+    # contains sobre un datetime completo solo calza con ese instante.
+    if 'contains' in values:
+        lookups['exact'] = values['contains']
+
+    ranges = []
+    if 'date' in values:
+        ranges.append((values['date'], values['date']))
+    if 'date__range' in values:
+        ranges.append(tuple(values['date__range']))
+    for first, last in ranges:
+        following = last + timedelta(days=1)
+        lookups.setdefault('range', []).append((
+            local_datetime(first.year, first.month, first.day),
+            local_datetime(following.year, following.month, following.day),
+        ))
+
+    bounds = {}
+    for part in CALENDAR_PARTS:
+        if part in values:
+            bounds[part] = (int(values[part]), int(values[part]))
+        if part + '__range' in values:
+            first, last = (int(value) for value in values[part + '__range'])
+            bounds[part] = (first, last)
+    span, rest = calendar_range(bounds)
+    if span is not None:
+        lookups.setdefault('range', []).append(span)
+    for part, (first, last) in rest.items():
+        if first == last:
+            lookups[part] = first
+        else:
+            lookups[part + '__range'] = (first, last)
+    return lookups
+
+
+class MeasurementDateFilterSet(filters.FilterSet):
+    """FilterSet whose date filters of ``date_fields`` go to ``date_time_medition`` as ranges."""
+
+    date_fields = (MEASUREMENT_FIELD, 'created')
+
+    def filter_queryset(self, queryset):
+        values = {field_name: {} for field_name in self.date_fields}
+        for name, value in self.form.cleaned_data.items():
+            field = self.filters[name]
+            if field.field_name not in values:
+                queryset = field.filter(queryset, value)
+            elif value not in (None, '', [], ()):
+                values[field.field_name][field.lookup_expr] = value
+        for field_values in values.values():
+            queryset = self.filter_measurement(queryset, field_values)
+        return queryset
+
+    def filter_measurement(self, queryset, values):
+        try:
+            lookups = measurement_lookups(values)
+        except (ValueError, OverflowError) as e:
+            raise ValidationError({MEASUREMENT_FIELD: [str(e)]})
+        # Varios rangos (fecha y año/mes/dia) se intersectan.
+        for start, end in lookups.pop('range', []):
+            queryset = queryset.filter(**{
+                MEASUREMENT_FIELD + '__gte': start, MEASUREMENT_FIELD + '__lt': end,
+            })
+        if lookups:
+            queryset = queryset.filter(**{
+                '{}__{}'.format(MEASUREMENT_FIELD, lookup): value for lookup, value in lookups.items()
+            })
+        return queryset
@@ -0,0 +1,163 @@
+"""Bulk upsert of readings sent through the API."""
+
+from datetime import datetime
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from api.crm.cache import readings_changed
+from api.crm.models import ProfileClient
+from api.crm.reports import reports_changed
+from api.crm.summaries import refresh_summaries
+
+from .persistence import clean_reading, execute_chunks, reading_columns
+from .rollups import reading_periods, rebuild_rollups
+
+
+def parse_profile_client(value):
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError('Se requiere el id de un pozo.')
+    return value
+
+
+def parse_date_time(value):
+    """Aware datetime of an ISO 8601 value; naive values are local time."""
+    if isinstance(value, str):
+        try:
+            value = parse_datetime(value.strip())
+        except ValueError:
+            value = None
+    if not isinstance(value, datetime):
+        raise ValueError('Se requiere una fecha ISO 8601.')
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+# Columnas que se validan de una vez antes de armar las lecturas.
+COLUMN_PARSERS = {
+    'profile_client': parse_profile_client,
+    'date_time_medition': parse_date_time,
+}
+
+# Mismas columnas que el INSERT del cron; una fila repetida actualiza la existente.
+UPSERT_SQL = """
+    INSERT INTO crm_interactiondetail
+        (created, modified, profile_client_id, date_time_medition, flow, total, nivel, is_send_dga)
+    SELECT %(now)s, %(now)s, r.profile_client_id, r.date_time_medition, r.flow, r.total, r.nivel, false
+    FROM unnest(%(profile_client)s::int[], %(date_time_medition)s::timestamptz[],
+                %(flow)s::float8[], %(total)s::bigint[], %(nivel)s::float8[])
+        AS r(profile_client_id, date_time_medition, flow, total, nivel)
+    ON CONFLICT (profile_client_id, date_time_medition) DO UPDATE
+    SET flow = EXCLUDED.flow, total = EXCLUDED.total, nivel = EXCLUDED.nivel, modified = EXCLUDED.modified
+    RETURNING created = %(now)s
+"""
+
+
+def reading_months(readings):
+    """``{(profile_client_id, first day of month)}`` of the readings."""
+    return {
+        (reading.profile_client_id, reading_periods(reading.date_time_medition)[1])
+        for reading in readings if reading.profile_client_id is not None
+    }
+
+
+def refresh_periods(months):
+    """Rebuild the rollups, summaries and reports derived from ``{(well, month)}``."""
+    since = {}
+    for profile_client_id, month in months:
+        since[profile_client_id] = min(month, since.get(profile_client_id, month))
+    for profile_client_id, month in since.items():
+        rebuild_rollups(profile_client_id, since=month)
+    refresh_summaries(set(since))
+    reports_changed(months)
+
+
+class BulkUpsert:
+    """Validates reading dicts and upserts them on (well, date_time_medition); the last repeated key wins."""
+
+    chunk_size = 10000
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.errors = {}
+        self.readings = {}
+        self.created = 0
+        self.updated = 0
+
+    def error(self, index, field, message):
+        self.errors.setdefault(index, {})[field] = [message]
+
+    def validate(self):
+        rows = [row if isinstance(row, dict) else None for row in self.rows]
+        for index, row in enumerate(rows):
+            if row is None:
+                self.error(index, 'non_field_errors', 'Se requiere un objeto.')
+
+        columns = {}
+        for field, parse in COLUMN_PARSERS.items():
+            column = columns[field] = []
+            for index, row in enumerate(rows):
+                if row is None:
+                    column.append(None)
+                    continue
+                try:
+                    column.append(parse(row.get(field)))
+                except ValueError as e:
+                    column.append(None)
+                    self.error(index, field, str(e))
+
+        wells = set(
+            ProfileClient.objects.filter(
+                pk__in={value for value in columns['profile_client'] if value is not None}
+            ).values_list('pk', flat=True)
+        )
+        for index, row in enumerate(rows):
+            if index in self.errors:
+                continue
+            if columns['profile_client'][index] not in wells:
+                self.error(index, 'profile_client', 'El pozo no existe.')
+                continue
+            try:
+                reading = clean_reading(dict(
+                    row, profile_client=columns['profile_client'][index],
+                    date_time_medition=columns['date_time_medition'][index],
+                ))
+            except ValueError as e:
+                self.error(index, 'non_field_errors', str(e))
+                continue
+            self.readings[(reading.profile_client_id, reading.date_time_medition)] = reading
+        return not self.errors
+
+    def save(self):
+        """Upsert the readings on the unique (well, date_time_medition) key and refresh the rollups."""
+        if not self.readings:
+            return
+        readings = list(self.readings.values())
+        wells = {reading.profile_client_id for reading in readings}
+        now = timezone.now()
+
+        with transaction.atomic():
+            # Las filas actualizadas conservan su created.
+            inserted = [
+                is_new for is_new, in execute_chunks(UPSERT_SQL, reading_columns(readings), now, self.chunk_size)
+            ]
+
+            # Lecturas antiguas o corregidas: se recalculan los meses tocados.
+            refresh_periods(reading_months(readings))
+
+        readings_changed(wells)
+        self.created = sum(inserted)
+        self.updated = len(inserted) - self.created
+
+    @property
+    def data(self):
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'failed': len(self.errors),
+            'errors': [{'row': index, 'errors': errors} for index, errors in sorted(self.errors.items())],
+        }
@@ -0,0 +1,138 @@
+"""Bulk persistence of ingested readings."""
+
+import math
+from datetime import datetime
+
+from django.db import connection
+from django.utils import timezone
+
+from api.crm.models import InteractionDetail
+
+
+# Una sentencia por bloque con las columnas como arreglos, sin preparar valor por valor.
+# La llave unica (pozo, fecha de medicion) resuelve las carreras entre cargas y el cron.
+INSERT_SQL = """
+    INSERT INTO crm_interactiondetail
+        (created, modified, profile_client_id, date_time_medition, flow, total, nivel, is_send_dga)
+    SELECT %(now)s, %(now)s, r.profile_client_id, r.date_time_medition, r.flow, r.total, r.nivel, false
+    FROM unnest(%(profile_client)s::int[], %(date_time_medition)s::timestamptz[],
+                %(flow)s::float8[], %(total)s::bigint[], %(nivel)s::float8[])
+        AS r(profile_client_id, date_time_medition, flow, total, nivel)
+    ON CONFLICT (profile_client_id, date_time_medition) DO NOTHING
+    RETURNING id, profile_client_id, date_time_medition
+"""
+
+NUMERIC_FIELDS = {
+    'flow': float,
+    'total': int,
+    'nivel': float,
+}
+
+
+def clean_reading(response):
+    """Typed check of a reading dict, an unsaved ``InteractionDetail``; raises ``ValueError``."""
+    profile_client = response.get('profile_client')
+    if isinstance(profile_client, bool) or not isinstance(profile_client, int):
+        raise ValueError('profile_client invalido: {!r}'.format(profile_client))
+
+    date_time_medition = response.get('date_time_medition')
+    if not isinstance(date_time_medition, datetime) or timezone.is_naive(date_time_medition):
+        raise ValueError('date_time_medition invalida: {!r}'.format(date_time_medition))
+
+    values = {}
+    for field, cast in NUMERIC_FIELDS.items():
+        value = response.get(field)
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            raise ValueError('{} no numerico: {!r}'.format(field, value))
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            raise ValueError('{} no numerico: {!r}'.format(field, value))
+        if not math.isfinite(number):
+            raise ValueError('{} no numerico: {!r}'.format(field, value))
+        values[field] = cast(number)
+
+    return InteractionDetail(
+        profile_client_id=profile_client,
+        date_time_medition=date_time_medition,
+        **values
+    )
+
+
+def reading_columns(readings):
+    return {
+        'profile_client': [reading.profile_client_id for reading in readings],
+        'date_time_medition': [reading.date_time_medition for reading in readings],
+        'flow': [reading.flow for reading in readings],
+        'total': [reading.total for reading in readings],
+        'nivel': [reading.nivel for reading in readings],
+    }
+
+
+def execute_chunks(sql, columns, now, chunk_size):
+    """Run ``sql`` over ``chunk_size`` slices of the ``columns`` arrays, return the ``RETURNING`` rows."""
+    size = len(next(iter(columns.values())))
+    rows = []
+    with connection.cursor() as cursor:
+        for start in range(0, size, chunk_size):
+            params = {name: values[start:start + chunk_size] for name, values in columns.items()}
+            cursor.execute(sql, dict(params, now=now))
+            rows.extend(cursor.fetchall())
+    return rows
+
+
+class IngestionReport:
+    """Counters of one ingestion run."""
+
+    def __init__(self):
+        self.inserted = 0
+        self.skipped = 0
+        self.failed = 0
+        self.errors = []
+
+    def fail(self, profile_client, error):
+        self.failed += 1
+        self.errors.append((profile_client, str(error)))
+
+    def __str__(self):
+        return 'insertados={} omitidos={} fallidos={}'.format(self.inserted, self.skipped, self.failed)
+
+
+class ReadingBatch:
+    """Readings of a cron run, inserted in a few statements."""
+
+    batch_size = 1000
+
+    def __init__(self):
+        self.readings = []
+        self.inserted = []
+        self.report = IngestionReport()
+
+    def add(self, response):
+        try:
+            self.readings.append(clean_reading(response))
+        except ValueError as e:
+            self.fail(response.get('profile_client'), e)
+
+    def fail(self, profile_client, error):
+        self.report.fail(profile_client, error)
+
+    def save(self):
+        if self.readings:
+            readings = {}
+            for reading in self.readings:
+                readings.setdefault((reading.profile_client_id, reading.date_time_medition), reading)
+            now = timezone.now()
+            rows = execute_chunks(INSERT_SQL, reading_columns(list(readings.values())), now, self.batch_size)
+
+            new_readings = []
+            for pk, profile_client_id, date_time_medition in rows:
+                reading = readings[(profile_client_id, date_time_medition)]
+                reading.pk, reading.created, reading.modified = pk, now, now
+                new_readings.append(reading)
+            self.inserted.extend(new_readings)
+            self.report.inserted += len(new_readings)
+            self.report.skipped += len(self.readings) - len(new_readings)
+        return self.report
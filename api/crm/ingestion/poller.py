@@ -0,0 +1,64 @@
+"""Concurrent HTTP poller for telemetry providers."""
+
+import asyncio
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+import aiohttp
+from django.conf import settings
+
+
+FetchRequest = namedtuple('FetchRequest', ['url', 'headers'])
+
+DEFAULTS = {
+    'TIMEOUT': 30,
+    'DEFAULT_HOST_CONCURRENCY': 10,
+    'HOST_CONCURRENCY': {},
+    'KEEPALIVE_TIMEOUT': 60,
+}
+
+
+def get_poller_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'TELEMETRY_POLLER', {}))
+    return config
+
+
+class Poller:
+    """Run many GET requests over pooled keep-alive connections, throttled per host."""
+
+    def __init__(self, host_concurrency=None, default_concurrency=None, timeout=None):
+        config = get_poller_settings()
+        self.host_concurrency = host_concurrency or config['HOST_CONCURRENCY']
+        self.default_concurrency = default_concurrency or config['DEFAULT_HOST_CONCURRENCY']
+        self.timeout = timeout or config['TIMEOUT']
+        self.keepalive_timeout = config['KEEPALIVE_TIMEOUT']
+        self._semaphores = {}
+
+    def _semaphore(self, host):
+        if host not in self._semaphores:
+            limit = self.host_concurrency.get(host, self.default_concurrency)
+            self._semaphores[host] = asyncio.Semaphore(limit)
+        return self._semaphores[host]
+
+    async def _fetch(self, session, request):
+        async with self._semaphore(urlsplit(request.url).hostname):
+            async with session.get(request.url, headers=request.headers) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+
+    async def _fetch_all(self, requests):
+        self._semaphores = {}
+        connector = aiohttp.TCPConnector(limit=0, keepalive_timeout=self.keepalive_timeout)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return await asyncio.gather(
+                *[self._fetch(session, request) for request in requests],
+                return_exceptions=True
+            )
+
+    def fetch_all(self, requests):
+        """Decoded JSON bodies of the requests in order; a failed request yields its exception."""
+        if not requests:
+            return []
+        return asyncio.run(self._fetch_all(requests))
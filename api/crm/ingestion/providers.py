@@ -0,0 +1,87 @@
+"""Telemetry providers."""
+
+from urllib.parse import urlencode
+
+from .poller import FetchRequest
+
+
+class TelemetryProvider:
+    """Base provider."""
+
+    name = None
+    # Decimales con los que se guardan caudal y nivel (None = sin redondeo).
+    precision = None
+
+    def build_request(self, token, variables):
+        """Request the last value of every variable name in ``variables``."""
+        raise NotImplementedError
+
+    def build_variable_request(self, token, variable):
+        """Request for one variable missing from a batched answer, None when not needed."""
+        return None
+
+    def parse(self, data, variables):
+        """Return ``{variable: value}`` from a response body, None when missing."""
+        raise NotImplementedError
+
+    def round(self, value):
+        if self.precision is None:
+            return value
+        return round(value, self.precision)
+
+
+class TagoIOProvider(TelemetryProvider):
+    """TagoIO device API, authenticated with the device token."""
+
+    name = 'tagoio'
+    url = 'https://api.tago.io/data/'
+
+    def build_request(self, token, variables):
+        # last_value trae el ultimo registro de cada variable (last_item solo el mas nuevo de todas).
+        query = [('variables[]', variable) for variable in variables]
+        query.append(('query', 'last_value'))
+        return FetchRequest('{}?{}'.format(self.url, urlencode(query)), {'authorization': token})
+
+    def build_variable_request(self, token, variable):
+        # Forma de una variable por consulta, la que se usaba antes de agrupar.
+        query = [('variable', variable), ('query', 'last_item')]
+        return FetchRequest('{}?{}'.format(self.url, urlencode(query)), {'authorization': token})
+
+    def parse(self, data, variables):
+        values = dict.fromkeys(variables)
+        for item in data.get('result') or []:
+            if item.get('variable') in values and values[item['variable']] is None:
+                values[item['variable']] = item.get('value')
+        return values
+
+
+class ThethingsProvider(TelemetryProvider):
+    """thethings.io things API, the thing token goes in the path."""
+
+    name = 'thethings'
+    url = 'https://api.thethings.io/v2/things/{token}/all_resources'
+    precision = 1
+
+    def build_request(self, token, variables):
+        return FetchRequest(self.url.format(token=token), {})
+
+    def parse(self, data, variables):
+        values = dict.fromkeys(variables)
+        for item in data or []:
+            if item.get('key') in values:
+                values[item['key']] = item.get('value')
+        return values
+
+
+PROVIDERS = {
+    TagoIOProvider.name: TagoIOProvider(),
+    ThethingsProvider.name: ThethingsProvider(),
+}
+
+
+def get_provider(profile):
+    """Provider used by a well (``ProfileClient`` or its serialized dict)."""
+    is_thethings = profile['is_thethings'] if isinstance(profile, dict) else profile.is_thethings
+    if is_thethings:
+        return PROVIDERS[ThethingsProvider.name]
+    return PROVIDERS[TagoIOProvider.name]
@@ -0,0 +1,119 @@
+"""Incremental maintenance of the daily and monthly rollups."""
+
+from django.db import transaction
+from django.utils import timezone
+
+from api.crm.models import InteractionDaily, InteractionDetail, InteractionMonthly
+from api.crm.partitions import month_start
+
+
+ROLLUP_FIELDS = [
+    'first_reading_at', 'last_reading_at', 'total_start', 'total_end', 'volume',
+    'flow_min', 'flow_max', 'flow_sum', 'flow_count', 'nivel_sum', 'nivel_count', 'samples',
+]
+
+
+def reading_periods(date_time_medition):
+    """Day and first day of the month of a reading, in local time."""
+    day = timezone.localtime(date_time_medition).date()
+    return day, day.replace(day=1)
+
+
+class RollupAccumulator:
+    """Feeds readings, in measurement order, into daily and monthly rollups."""
+
+    def __init__(self, daily=None, monthly=None, previous_totals=None):
+        self.daily = daily or {}
+        self.monthly = monthly or {}
+        self.previous_totals = previous_totals or {}
+
+    def add(self, profile_client_id, date_time_medition, flow, total, nivel):
+        day, month = reading_periods(date_time_medition)
+        previous_total = self.previous_totals.get(profile_client_id)
+
+        daily = self.daily.get((profile_client_id, day))
+        if daily is None:
+            daily = self.daily[(profile_client_id, day)] = InteractionDaily(
+                profile_client_id=profile_client_id, day=day
+            )
+        daily.add(date_time_medition, flow, total, nivel, previous_total)
+
+        monthly = self.monthly.get((profile_client_id, month))
+        if monthly is None:
+            monthly = self.monthly[(profile_client_id, month)] = InteractionMonthly(
+                profile_client_id=profile_client_id, month=month
+            )
+        monthly.add(date_time_medition, flow, total, nivel, previous_total)
+
+        if total is not None:
+            self.previous_totals[profile_client_id] = total
+
+    def save(self):
+        for rollups in (self.daily.values(), self.monthly.values()):
+            new_rollups = [rollup for rollup in rollups if rollup.pk is None]
+            old_rollups = [rollup for rollup in rollups if rollup.pk is not None]
+            if new_rollups:
+                type(new_rollups[0]).objects.bulk_create(new_rollups)
+            if old_rollups:
+                type(old_rollups[0]).objects.bulk_update(old_rollups, ROLLUP_FIELDS)
+
+
+def apply_readings(readings, previous_totals=None):
+    """Add freshly stored readings to their rollups; ``previous_totals`` is each well's totalizer before them."""
+    if not readings:
+        return
+    # Una lectura anterior a otras ya agregadas no corrige total_start de los periodos siguientes (rebuild_rollups).
+    readings = sorted(readings, key=lambda reading: reading.date_time_medition)
+    wells = {reading.profile_client_id for reading in readings}
+    periods = [reading_periods(reading.date_time_medition) for reading in readings]
+
+    with transaction.atomic():
+        daily = InteractionDaily.objects.select_for_update().filter(
+            profile_client_id__in=wells, day__in={day for day, _ in periods}
+        )
+        monthly = InteractionMonthly.objects.select_for_update().filter(
+            profile_client_id__in=wells, month__in={month for _, month in periods}
+        )
+        accumulator = RollupAccumulator(
+            daily={(rollup.profile_client_id, rollup.day): rollup for rollup in daily},
+            monthly={(rollup.profile_client_id, rollup.month): rollup for rollup in monthly},
+            previous_totals=dict(previous_totals or {}),
+        )
+        for reading in readings:
+            accumulator.add(
+                reading.profile_client_id, reading.date_time_medition,
+                reading.flow, reading.total, reading.nivel
+            )
+        accumulator.save()
+
+
+def rebuild_rollups(profile_client_id, since=None):
+    """Recompute the rollups of one well from its readings, from the month of ``since`` on."""
+    readings = InteractionDetail.objects.filter(profile_client_id=profile_client_id)
+    daily = InteractionDaily.objects.filter(profile_client_id=profile_client_id)
+    monthly = InteractionMonthly.objects.filter(profile_client_id=profile_client_id)
+    previous_totals = {}
+
+    if since is not None:
+        since = since.replace(day=1)
+        daily = daily.filter(day__gte=since)
+        monthly = monthly.filter(month__gte=since)
+        start = month_start(since.year, since.month)
+        previous = readings.filter(
+            date_time_medition__lt=start, total__isnull=False
+        ).order_by('-date_time_medition', '-id').first()
+        if previous is not None:
+            previous_totals[profile_client_id] = previous.total
+        readings = readings.filter(date_time_medition__gte=start)
+
+    with transaction.atomic():
+        daily.delete()
+        monthly.delete()
+        accumulator = RollupAccumulator(previous_totals=previous_totals)
+        rows = readings.order_by('date_time_medition', 'id').values_list(
+            'date_time_medition', 'flow', 'total', 'nivel'
+        )
+        for date_time_medition, flow, total, nivel in rows.iterator(chunk_size=5000):
+            accumulator.add(profile_client_id, date_time_medition, flow, total, nivel)
+        accumulator.save()
+    return len(accumulator.daily), len(accumulator.monthly)
@@ -0,0 +1,26 @@
+"""Well configuration loader shared by the cron jobs."""
+
+from api.crm.models import InteractionDetail, ProfileClient
+from api.crm.models.interaction_detail import LATEST_ORDERING
+
+
+def load_wells(reference=None, **filters):
+    """Wells matching ``filters`` for the cron jobs, with ``last_reading`` and ``reference_reading``."""
+    wells = list(ProfileClient.objects.filter(**filters).prefetch_related('variable_profile'))
+
+    readings = {
+        reading.profile_client_id: reading
+        for reading in InteractionDetail.objects.latest_per_well([well.id for well in wells])
+    }
+    for well in wells:
+        well.last_reading = readings.get(well.id)
+
+    if reference is not None:
+        references = InteractionDetail.objects.filter(
+            profile_client__in=[well.id for well in wells], **reference
+        ).order_by('profile_client_id', *LATEST_ORDERING).distinct('profile_client_id')
+        references = {reading.profile_client_id: reading for reading in references}
+        for well in wells:
+            well.reference_reading = references.get(well.id)
+
+    return wells
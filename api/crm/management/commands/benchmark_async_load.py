@@ -0,0 +1,82 @@
+"""Load benchmark: latency of cheap requests while slow exports are running."""
+
+import asyncio
+import time
+
+import aiohttp
+from django.core.management.base import BaseCommand
+
+from api.crm.management.commands.benchmark_latest_reading import percentile
+
+
+async def timed_get(session, url):
+    start = time.perf_counter()
+    async with session.get(url) as response:
+        await response.read()
+        status = response.status
+    return (time.perf_counter() - start) * 1000, status
+
+
+class Command(BaseCommand):
+    help = (
+        'Mide p50/p95/p99 de endpoints livianos contra un servidor en marcha (WSGI o ASGI), '
+        'primero solos y luego con exportaciones lentas en curso.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--token', required=True)
+        parser.add_argument('--cheap', action='append', metavar='PATH',
+                            help='Endpoint liviano (se puede repetir). Por defecto la ultima lectura del pozo 1.')
+        parser.add_argument('--slow', default='/api/interaction_detail/?format=xlsx&profile_client=1',
+                            metavar='PATH', help='Endpoint lento que se repite en paralelo.')
+        parser.add_argument('--slow-concurrency', type=int, default=4)
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument('--concurrency', type=int, default=10)
+
+    def handle(self, *args, **options):
+        asyncio.run(self.run(options))
+
+    async def run(self, options):
+        base = options['base_url'].rstrip('/')
+        cheap = [base + path for path in (options['cheap'] or ['/api/async/latest/?profile_client=1'])]
+        headers = {'Authorization': 'Token {}'.format(options['token'])}
+        timeout = aiohttp.ClientTimeout(total=600)
+
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            self.stdout.write('{:<22} {:>8} {:>8} {:>8} {:>8} {:>8} {:>8}'.format(
+                'carga', 'n', 'errores', 'p50 ms', 'p95 ms', 'p99 ms', 'lentas'
+            ))
+            await self.measure(session, 'sin exportaciones', cheap, options)
+
+            stop = asyncio.Event()
+            finished = []
+
+            async def slow_loop():
+                while not stop.is_set():
+                    finished.append(await timed_get(session, base + options['slow']))
+
+            slow = [asyncio.create_task(slow_loop()) for _ in range(options['slow_concurrency'])]
+            # Las exportaciones alcanzan a ocupar los workers antes de medir.
+            await asyncio.sleep(1)
+            await self.measure(session, 'con {} exportaciones'.format(len(slow)), cheap, options, finished)
+            stop.set()
+            await asyncio.gather(*slow)
+
+    async def measure(self, session, label, urls, options, finished=()):
+        queue = asyncio.Queue()
+        for index in range(options['requests']):
+            queue.put_nowait(urls[index % len(urls)])
+        results = []
+
+        async def worker():
+            while not queue.empty():
+                results.append(await timed_get(session, queue.get_nowait()))
+
+        await asyncio.gather(*(worker() for _ in range(options['concurrency'])))
+        timings = [elapsed for elapsed, _ in results]
+        errors = sum(1 for _, status in results if status >= 400)
+        self.stdout.write('{:<22} {:>8} {:>8} {:>8.1f} {:>8.1f} {:>8.1f} {:>8}'.format(
+            label, len(results), errors, percentile(timings, 0.5), percentile(timings, 0.95),
+            percentile(timings, 0.99), len(finished)
+        ))
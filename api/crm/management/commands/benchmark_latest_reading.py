@@ -0,0 +1,93 @@
+"""Benchmark of the latest reading lookups."""
+
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from api.crm import partitions
+from api.crm.models import InteractionDetail, ProfileClient, User
+
+
+INSERT_SQL = """
+    INSERT INTO crm_interactiondetail
+        (created, modified, date_time_medition, profile_client_id, flow, total, nivel, is_send_dga)
+    SELECT ts, ts, ts, (%(wells)s::int[])[1 + g %% %(count)s], random() * 10, g, random() * 50, false
+    FROM generate_series(%(start)s, %(stop)s - 1) AS g,
+        LATERAL (SELECT now() - (%(stop)s - g) * interval '10 seconds' AS ts) AS t
+"""
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Mide latest_for y latest_per_well con tablas de distinto tamano. '
+        'Inserta datos sinteticos dentro de una transaccion que se revierte al final; '
+        'no correr en produccion.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--wells', type=int, default=200)
+        parser.add_argument('--sizes', default='10000,100000,1000000')
+        parser.add_argument('--repeat', type=int, default=200)
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options['sizes'].split(','))
+        repeat = options['repeat']
+
+        with transaction.atomic():
+            user = User.objects.create(
+                username='benchmark-latest', email='benchmark-latest@smarthydro.cl'
+            )
+            wells = ProfileClient.objects.bulk_create(
+                [ProfileClient(user=user, title='benchmark {}'.format(i)) for i in range(options['wells'])]
+            )
+            well_ids = [well.id for well in wells]
+
+            # Particiones para todo el rango de fechas generado.
+            oldest = timezone.localtime(timezone.now() - timedelta(seconds=10 * sizes[-1]))
+            existing = {(year, month) for _, year, month, _, _ in partitions.list_partitions()}
+            month = (oldest.year, oldest.month)
+            while month <= partitions.current_month():
+                if month not in existing:
+                    partitions.create_partition(*month)
+                month = partitions.add_months(*month, 1)
+
+            self.stdout.write('{:>12} {:>16} {:>16} {:>20}'.format(
+                'filas', 'latest_for ms', 'latest_for p95', 'latest_per_well ms'
+            ))
+            inserted = 0
+            for size in sizes:
+                with connection.cursor() as cursor:
+                    cursor.execute(INSERT_SQL, {
+                        'wells': well_ids, 'count': len(well_ids),
+                        'start': inserted, 'stop': size,
+                    })
+                    cursor.execute('ANALYZE crm_interactiondetail')
+                inserted = size
+
+                single = []
+                for _ in range(repeat):
+                    well_id = random.choice(well_ids)
+                    start = time.perf_counter()
+                    InteractionDetail.objects.latest_for(well_id)
+                    single.append((time.perf_counter() - start) * 1000)
+
+                bulk = []
+                for _ in range(max(1, repeat // 20)):
+                    start = time.perf_counter()
+                    list(InteractionDetail.objects.latest_per_well(well_ids))
+                    bulk.append((time.perf_counter() - start) * 1000)
+
+                self.stdout.write('{:>12} {:>16.3f} {:>16.3f} {:>20.3f}'.format(
+                    size, sum(single) / len(single), percentile(single, 0.95), sum(bulk) / len(bulk)
+                ))
+
+            transaction.set_rollback(True)
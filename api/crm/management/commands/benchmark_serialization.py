@@ -0,0 +1,78 @@
+"""Benchmark of the serializer and values_list() list paths."""
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from api.crm import partitions
+from api.crm.management.commands.benchmark_latest_reading import INSERT_SQL
+from api.crm.models import InteractionDetail, ProfileClient, User
+from api.crm.serializers import InteractionDetailModelSerializer
+from api.crm.values_serialization import ValuesReader
+
+
+def best_of(repeat, render):
+    timings, output = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = render()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings), output
+
+
+class Command(BaseCommand):
+    help = (
+        'Compara el JSON de lecturas por el serializer y por values_list() (tiempo y bytes). '
+        'Inserta datos sinteticos dentro de una transaccion que se revierte al final; '
+        'no correr en produccion.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,100000')
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options['sizes'].split(','))
+        repeat = options['repeat']
+        renderer = JSONRenderer()
+
+        with transaction.atomic():
+            user = User.objects.create(
+                username='benchmark-serialization', email='benchmark-serialization@smarthydro.cl'
+            )
+            well = ProfileClient.objects.create(user=user, title='benchmark')
+
+            oldest = timezone.localtime(timezone.now() - timedelta(seconds=10 * sizes[-1]))
+            existing = {(year, month) for _, year, month, _, _ in partitions.list_partitions()}
+            month = (oldest.year, oldest.month)
+            while month <= partitions.current_month():
+                if month not in existing:
+                    partitions.create_partition(*month)
+                month = partitions.add_months(*month, 1)
+
+            with connection.cursor() as cursor:
+                cursor.execute(INSERT_SQL, {'wells': [well.id], 'count': 1, 'start': 0, 'stop': sizes[-1]})
+                cursor.execute('ANALYZE crm_interactiondetail')
+
+            self.stdout.write('{:>10} {:>16} {:>16} {:>8} {:>10}'.format(
+                'filas', 'serializer ms', 'values ms', 'x', 'iguales'
+            ))
+            readings = InteractionDetail.objects.filter(profile_client=well).order_by('-date_time_medition', '-id')
+            for size in sizes:
+                queryset = readings[:size]
+                slow, expected = best_of(repeat, lambda: renderer.render(
+                    InteractionDetailModelSerializer(queryset, many=True).data
+                ))
+                reader = ValuesReader.for_serializer(InteractionDetailModelSerializer())
+                fast, output = best_of(repeat, lambda: renderer.render(
+                    reader.data(reader.values_list(queryset))
+                ))
+                self.stdout.write('{:>10} {:>16.1f} {:>16.1f} {:>8.1f} {:>10}'.format(
+                    size, slow, fast, slow / fast, 'si' if output == expected else 'NO'
+                ))
+
+            transaction.set_rollback(True)
@@ -0,0 +1,44 @@
+"""Maintenance of the monthly partitions of InteractionDetail."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.crm import partitions
+
+
+class Command(BaseCommand):
+    help = (
+        'Crea las particiones mensuales de crm_interactiondetail de los proximos meses '
+        'y permite desconectar o volver a conectar particiones antiguas.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ahead', type=int, default=3,
+                            help='Meses futuros con particion creada (por defecto 3).')
+        parser.add_argument('--detach-older-than', type=int, metavar='MESES',
+                            help='Desconecta las particiones anteriores a esta cantidad de meses.')
+        parser.add_argument('--attach', metavar='TABLA',
+                            help='Vuelve a conectar una particion desconectada.')
+        parser.add_argument('--list', action='store_true', help='Lista las particiones.')
+
+    def handle(self, *args, **options):
+        if options['list']:
+            for name, year, month, is_attached, rows in partitions.list_partitions():
+                self.stdout.write('{}  {:04d}-{:02d}  {}  ~{} filas'.format(
+                    name, year, month, 'conectada' if is_attached else 'desconectada', rows
+                ))
+            return
+
+        if options['attach']:
+            try:
+                partitions.attach_partition(options['attach'])
+            except ValueError as e:
+                raise CommandError(e)
+            self.stdout.write('Particion conectada {}'.format(options['attach']))
+            return
+
+        for name in partitions.ensure_partitions(ahead=options['ahead']):
+            self.stdout.write('Particion creada {}'.format(name))
+
+        if options['detach_older_than'] is not None:
+            for name in partitions.detach_partitions(options['detach_older_than']):
+                self.stdout.write('Particion desconectada {}'.format(name))
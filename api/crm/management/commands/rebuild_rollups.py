@@ -0,0 +1,37 @@
+"""Rebuild of the daily and monthly rollups from the raw readings."""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.crm.ingestion.rollups import rebuild_rollups
+from api.crm.models import ProfileClient
+
+
+class Command(BaseCommand):
+    help = (
+        'Recalcula los resumenes diarios y mensuales de las lecturas. '
+        'Sirve para la carga inicial y para corregir datos historicos modificados.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile-client', type=int, action='append', dest='profile_clients',
+                            metavar='ID', help='Pozo a recalcular (se puede repetir). Por defecto todos.')
+        parser.add_argument('--since', metavar='AAAA-MM-DD',
+                            help='Recalcula desde el mes de esta fecha. Por defecto todo el historial.')
+
+    def handle(self, *args, **options):
+        since = None
+        if options['since']:
+            try:
+                since = date.fromisoformat(options['since'])
+            except ValueError:
+                raise CommandError('Fecha invalida: {}'.format(options['since']))
+
+        wells = ProfileClient.objects.order_by('id').values_list('id', flat=True)
+        if options['profile_clients']:
+            wells = wells.filter(id__in=options['profile_clients'])
+
+        for profile_client_id in wells:
+            days, months = rebuild_rollups(profile_client_id, since)
+            self.stdout.write('Pozo {}: {} dias, {} meses'.format(profile_client_id, days, months))
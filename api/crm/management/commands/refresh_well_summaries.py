@@ -0,0 +1,24 @@
+"""Refresh of the per-well summary table."""
+
+from django.core.management.base import BaseCommand
+
+from api.crm.summaries import backfill_dga_results, refresh_summaries
+
+
+class Command(BaseCommand):
+    help = (
+        'Recalcula la tabla de resumen por pozo (vista de flota). '
+        'La ingesta la mantiene al dia; sirve para la carga inicial.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile-client', type=int, action='append', dest='profile_clients',
+                            metavar='ID', help='Pozo a recalcular (se puede repetir). Por defecto todos.')
+        parser.add_argument('--dga', action='store_true',
+                            help='Completa el ultimo resultado DGA desde las lecturas (recorre el historial).')
+
+    def handle(self, *args, **options):
+        count = refresh_summaries(options['profile_clients'])
+        self.stdout.write('{} pozos actualizados'.format(count))
+        if options['dga']:
+            self.stdout.write('{} resultados DGA completados'.format(backfill_dga_results()))
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0073_user_txt_password'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interactiondetail',
+            name='flow_value',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='interactiondetail',
+            name='nivel_value',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='interactiondetail',
+            name='total_value',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Copia flow/total/nivel (texto) a las nuevas columnas numericas.
+#
+# Corre fuera de una transaccion unica: cada bloque de ids se confirma por
+# separado, asi la tabla nunca queda bloqueada y si la migracion se corta
+# basta con volver a ejecutar migrate, los bloques ya convertidos se saltan.
+
+from django.db import migrations, transaction
+
+
+CHUNK_SIZE = 10000
+
+NUMBER = r"'^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$'"
+
+BACKFILL_SQL = """
+    UPDATE crm_interactiondetail SET
+        flow_value = CASE WHEN flow ~ {number} THEN
+            CASE WHEN abs(flow::numeric) < 1e300 THEN flow::numeric::double precision END END,
+        total_value = CASE WHEN total ~ {number} THEN
+            CASE WHEN abs(total::numeric) < 9e18 THEN trunc(total::numeric)::bigint END END,
+        nivel_value = CASE WHEN nivel ~ {number} THEN
+            CASE WHEN abs(nivel::numeric) < 1e300 THEN nivel::numeric::double precision END END
+    WHERE id >= %s AND id < %s
+        AND flow_value IS NULL AND total_value IS NULL AND nivel_value IS NULL
+        AND (flow IS NOT NULL OR total IS NOT NULL OR nivel IS NOT NULL)
+""".format(number=NUMBER)
+
+
+def backfill_values(apps, schema_editor):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT min(id), max(id) FROM crm_interactiondetail')
+        first_id, last_id = cursor.fetchone()
+
+    if first_id is None:
+        return
+
+    for start in range(first_id, last_id + 1, CHUNK_SIZE):
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(BACKFILL_SQL, [start, start + CHUNK_SIZE])
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('crm', '0074_interactiondetail_flow_value_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_values, migrations.RunPython.noop, elidable=True),
+    ]
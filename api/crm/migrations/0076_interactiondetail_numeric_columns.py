@@ -0,0 +1,57 @@
+# Reemplaza las columnas de texto flow/total/nivel por las numericas.
+#
+# Antes del cambio se vuelve a pasar el backfill para las filas que se
+# insertaron mientras corria 0075.
+
+from importlib import import_module
+
+from django.db import migrations
+
+
+backfill = import_module('api.crm.migrations.0075_backfill_interactiondetail_values')
+
+
+def restore_text_values(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            'UPDATE crm_interactiondetail SET flow = flow_value::text, '
+            'total = total_value::text, nivel = nivel_value::text'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0075_backfill_interactiondetail_values'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill.backfill_values, restore_text_values),
+        migrations.RemoveField(
+            model_name='interactiondetail',
+            name='flow',
+        ),
+        migrations.RemoveField(
+            model_name='interactiondetail',
+            name='total',
+        ),
+        migrations.RemoveField(
+            model_name='interactiondetail',
+            name='nivel',
+        ),
+        migrations.RenameField(
+            model_name='interactiondetail',
+            old_name='flow_value',
+            new_name='flow',
+        ),
+        migrations.RenameField(
+            model_name='interactiondetail',
+            old_name='total_value',
+            new_name='total',
+        ),
+        migrations.RenameField(
+            model_name='interactiondetail',
+            old_name='nivel_value',
+            new_name='nivel',
+        ),
+    ]
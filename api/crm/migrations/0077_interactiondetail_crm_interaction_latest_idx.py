@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:51
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY no puede correr dentro de una transaccion.
+    atomic = False
+
+    dependencies = [
+        ('crm', '0076_interactiondetail_numeric_columns'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='interactiondetail',
+            index=models.Index(fields=['profile_client', '-created', '-modified'], name='crm_interaction_latest_idx'),
+        ),
+    ]
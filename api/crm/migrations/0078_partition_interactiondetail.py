@@ -0,0 +1,133 @@
+# Convierte crm_interactiondetail en una tabla particionada por mes
+# sobre date_time_medition (ver api/crm/partitions.py).
+#
+# La tabla se reconstruye: se renombra la actual, se crea la particionada con
+# una particion por cada mes con datos, una futura para los proximos meses y
+# una por defecto, se copian las filas y se recrean secuencia, llaves e
+# indices. Las lecturas sin date_time_medition toman su fecha de creacion.
+# Bloquea la tabla mientras copia, correr en una ventana de mantencion.
+
+from datetime import datetime
+
+import pytz
+from django.conf import settings
+from django.db import migrations, models
+import django.utils.timezone
+
+
+TABLE = 'crm_interactiondetail'
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    'id', 'created', 'modified', 'date_time_medition', 'profile_client_id',
+    'is_send_dga', 'soap_return', 'flow', 'nivel', 'total',
+)
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE {table} (
+        id integer NOT NULL,
+        created timestamp with time zone NOT NULL,
+        modified timestamp with time zone NOT NULL,
+        date_time_medition timestamp with time zone {date_null},
+        profile_client_id integer NULL,
+        is_send_dga boolean NOT NULL,
+        soap_return text NULL,
+        flow double precision NULL,
+        nivel double precision NULL,
+        total bigint NULL
+    ) {partition_by}
+"""
+
+
+def add_months(year, month, months):
+    index = year * 12 + month - 1 + months
+    return index // 12, index % 12 + 1
+
+
+def month_start(year, month):
+    return pytz.timezone(settings.TIME_ZONE).localize(datetime(year, month, 1))
+
+
+def rebuild_table(apps, schema_editor, partitioned):
+    model = apps.get_model('crm', 'InteractionDetail')
+    old_table = TABLE + '_old'
+    execute = schema_editor.execute
+
+    execute('ALTER TABLE {} RENAME TO {}'.format(TABLE, old_table))
+    execute(CREATE_TABLE_SQL.format(
+        table=TABLE,
+        date_null='NOT NULL' if partitioned else 'NULL',
+        partition_by='PARTITION BY RANGE (date_time_medition)' if partitioned else '',
+    ))
+
+    date_time_medition = 'date_time_medition'
+    if partitioned:
+        date_time_medition = 'COALESCE(date_time_medition, created)'
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT DISTINCT date_trunc('month', COALESCE(date_time_medition, created) AT TIME ZONE %s) "
+                "FROM {}".format(old_table),
+                [settings.TIME_ZONE],
+            )
+            months = {(row[0].year, row[0].month) for row in cursor.fetchall()}
+        now = datetime.now(pytz.timezone(settings.TIME_ZONE))
+        months.update(add_months(now.year, now.month, offset) for offset in range(MONTHS_AHEAD + 1))
+
+        for year, month in sorted(months):
+            execute(
+                'CREATE TABLE {}_y{:04d}m{:02d} PARTITION OF {} FOR VALUES FROM (%s) TO (%s)'.format(
+                    TABLE, year, month, TABLE
+                ),
+                [month_start(year, month), month_start(*add_months(year, month, 1))],
+            )
+        execute('CREATE TABLE {}_default PARTITION OF {} DEFAULT'.format(TABLE, TABLE))
+
+    columns = ', '.join(COLUMNS)
+    execute('INSERT INTO {} ({}) SELECT {} FROM {}'.format(
+        TABLE, columns, columns.replace('date_time_medition', date_time_medition), old_table
+    ))
+    execute('DROP TABLE {} CASCADE'.format(old_table))
+
+    sequence = TABLE + '_id_seq'
+    execute('CREATE SEQUENCE {} AS integer OWNED BY {}.id'.format(sequence, TABLE))
+    execute("ALTER TABLE {} ALTER COLUMN id SET DEFAULT nextval('{}')".format(TABLE, sequence))
+    execute("SELECT setval('{}', COALESCE(max(id), 0) + 1, false) FROM {}".format(sequence, TABLE))
+    execute('ALTER TABLE {} ADD PRIMARY KEY ({})'.format(
+        TABLE, 'id, date_time_medition' if partitioned else 'id'
+    ))
+
+    profile_client = model._meta.get_field('profile_client')
+    execute(schema_editor._create_fk_sql(model, profile_client, '_fk_%(to_table)s_%(to_column)s'))
+    execute(schema_editor._create_index_sql(model, fields=[profile_client]))
+    for index in model._meta.indexes:
+        schema_editor.add_index(model, index)
+
+
+def partition_table(apps, schema_editor):
+    rebuild_table(apps, schema_editor, partitioned=True)
+
+
+def unpartition_table(apps, schema_editor):
+    rebuild_table(apps, schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0077_interactiondetail_crm_interaction_latest_idx'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='interactiondetail',
+                    name='date_time_medition',
+                    field=models.DateTimeField(blank=True, default=django.utils.timezone.now, max_length=800),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(partition_table, unpartition_table),
+            ],
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:58
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0078_partition_interactiondetail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InteractionMonthly',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Fecha de creacion.', verbose_name='created at')),
+                ('modified', models.DateTimeField(auto_now_add=True, help_text='Fecha de modificacion.', verbose_name='modified at')),
+                ('first_reading_at', models.DateTimeField(blank=True, null=True)),
+                ('last_reading_at', models.DateTimeField(blank=True, null=True)),
+                ('total_start', models.BigIntegerField(blank=True, null=True)),
+                ('total_end', models.BigIntegerField(blank=True, null=True)),
+                ('volume', models.BigIntegerField(default=0)),
+                ('flow_min', models.FloatField(blank=True, null=True)),
+                ('flow_max', models.FloatField(blank=True, null=True)),
+                ('flow_sum', models.FloatField(default=0)),
+                ('flow_count', models.IntegerField(default=0)),
+                ('nivel_sum', models.FloatField(default=0)),
+                ('nivel_count', models.IntegerField(default=0)),
+                ('samples', models.IntegerField(default=0)),
+                ('month', models.DateField()),
+                ('profile_client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to='crm.profileclient')),
+            ],
+            options={
+                'ordering': ['-month'],
+                'abstract': False,
+                'unique_together': {('profile_client', 'month')},
+            },
+        ),
+        migrations.CreateModel(
+            name='InteractionDaily',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Fecha de creacion.', verbose_name='created at')),
+                ('modified', models.DateTimeField(auto_now_add=True, help_text='Fecha de modificacion.', verbose_name='modified at')),
+                ('first_reading_at', models.DateTimeField(blank=True, null=True)),
+                ('last_reading_at', models.DateTimeField(blank=True, null=True)),
+                ('total_start', models.BigIntegerField(blank=True, null=True)),
+                ('total_end', models.BigIntegerField(blank=True, null=True)),
+                ('volume', models.BigIntegerField(default=0)),
+                ('flow_min', models.FloatField(blank=True, null=True)),
+                ('flow_max', models.FloatField(blank=True, null=True)),
+                ('flow_sum', models.FloatField(default=0)),
+                ('flow_count', models.IntegerField(default=0)),
+                ('nivel_sum', models.FloatField(default=0)),
+                ('nivel_count', models.IntegerField(default=0)),
+                ('samples', models.IntegerField(default=0)),
+                ('day', models.DateField()),
+                ('profile_client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='crm.profileclient')),
+            ],
+            options={
+                'ordering': ['-day'],
+                'abstract': False,
+                'unique_together': {('profile_client', 'day')},
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-18 07:02
+#
+# Indices normales y no CONCURRENTLY: Postgres no permite crear indices
+# concurrentes sobre una tabla particionada (se crean en cada particion).
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0079_interaction_rollups'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interactiondetail',
+            index=models.Index(fields=['profile_client', '-date_time_medition', '-id'], name='crm_interaction_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interactiondetail',
+            index=models.Index(fields=['-date_time_medition', '-id'], name='crm_interaction_dtm_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-18 07:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0080_interactiondetail_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportExport',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Fecha de creacion.', verbose_name='created at')),
+                ('modified', models.DateTimeField(auto_now_add=True, help_text='Fecha de modificacion.', verbose_name='modified at')),
+                ('month', models.DateField()),
+                ('status', models.CharField(choices=[('PENDING', 'pending'), ('RUNNING', 'running'), ('DONE', 'done'), ('FAILED', 'failed')], default='PENDING', max_length=10)),
+                ('file', models.FileField(blank=True, null=True, upload_to='reports/')),
+                ('content_hash', models.CharField(blank=True, max_length=64, null=True)),
+                ('rows', models.IntegerField(default=0)),
+                ('is_closed', models.BooleanField(default=False)),
+                ('built_at', models.DateTimeField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('profile_client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reports', to='crm.profileclient')),
+            ],
+            options={
+                'ordering': ['-created', '-modified'],
+                'abstract': False,
+                'unique_together': {('profile_client', 'month')},
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-18 07:25
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0081_report_export'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WellSummary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Fecha de creacion.', verbose_name='created at')),
+                ('modified', models.DateTimeField(auto_now_add=True, help_text='Fecha de modificacion.', verbose_name='modified at')),
+                ('last_reading_at', models.DateTimeField(blank=True, null=True)),
+                ('last_flow', models.FloatField(blank=True, null=True)),
+                ('last_total', models.BigIntegerField(blank=True, null=True)),
+                ('last_nivel', models.FloatField(blank=True, null=True)),
+                ('month', models.DateField(blank=True, null=True)),
+                ('month_volume', models.BigIntegerField(default=0)),
+                ('month_flow_avg', models.FloatField(blank=True, null=True)),
+                ('month_flow_max', models.FloatField(blank=True, null=True)),
+                ('flow_granted', models.FloatField(blank=True, null=True)),
+                ('over_granted', models.BooleanField(default=False)),
+                ('dga_sent_at', models.DateTimeField(blank=True, null=True)),
+                ('dga_ok', models.BooleanField(blank=True, null=True)),
+                ('dga_response', models.TextField(blank=True, null=True)),
+                ('profile_client', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='summary', to='crm.profileclient')),
+            ],
+            options={
+                'ordering': ['-created', '-modified'],
+                'abstract': False,
+                'indexes': [models.Index(models.OrderBy(models.F('last_reading_at'), nulls_first=True), models.F('id'), name='crm_summary_freshness_idx')],
+            },
+        ),
+    ]
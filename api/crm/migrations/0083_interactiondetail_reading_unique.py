@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-18 07:45
+#
+# Antes de la llave unica se borran las lecturas repetidas de un pozo en la
+# misma hora de medicion; queda la ultima insertada (id mayor).
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0082_well_summary'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            """
+            DELETE FROM crm_interactiondetail a
+            USING crm_interactiondetail b
+            WHERE a.profile_client_id = b.profile_client_id
+                AND a.date_time_medition = b.date_time_medition
+                AND a.id < b.id
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='interactiondetail',
+            constraint=models.UniqueConstraint(fields=('profile_client', 'date_time_medition'), name='crm_interaction_reading_uniq'),
+        ),
+    ]
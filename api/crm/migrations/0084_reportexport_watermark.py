@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 07:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0083_interactiondetail_reading_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reportexport',
+            name='watermark',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
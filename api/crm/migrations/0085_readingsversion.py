@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:00
+
+from django.db import migrations, models
+
+
+def create_version(apps, schema_editor):
+    apps.get_model('crm', 'ReadingsVersion').objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0084_reportexport_watermark'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReadingsVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.BigIntegerField(default=1)),
+            ],
+        ),
+        migrations.RunPython(create_version, migrations.RunPython.noop),
+    ]
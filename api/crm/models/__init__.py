@@ -3,3 +3,7 @@ from .users import User
 from .interaction_detail import InteractionDetail
 from .client_profile import (ProfileClient, RegisterPersons, 
                         DataHistoryFact, VariableClient)
+from .rollups import InteractionDaily, InteractionMonthly
+from .reports import ReportExport
+from .summaries import WellSummary
+from .cache import ReadingsVersion
@@ -0,0 +1,9 @@
+"""Version of the cached well payloads."""
+
+from django.db import models
+
+
+class ReadingsVersion(models.Model):
+    """Single row bumped whenever readings change (see ``api/crm/cache.py``)."""
+
+    version = models.BigIntegerField(default=1)
@@ -1,16 +1,82 @@
+from datetime import timedelta
+
 from django.db import models
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
 from .utils import ModelApi
 from .client_profile import ProfileClient
 
+
+# La lectura mas nueva es la de medicion mas reciente, no la ultima insertada
+# (una carga masiva de dias pasados se inserta despues). Cubierto por crm_interaction_keyset_idx.
+LATEST_ORDERING = ('-date_time_medition', '-id')
+
+
+class InteractionDetailQuerySet(models.QuerySet):
+
+    def recent(self):
+        """Readings measured since the start of the previous month (two partitions)."""
+        first_day = timezone.localtime().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        previous_month = (first_day - timedelta(days=1)).replace(day=1)
+        return self.filter(date_time_medition__gte=previous_month)
+
+    def latest_for(self, profile_client):
+        """Newest reading of one well, None when it has no readings."""
+        readings = self.filter(profile_client=profile_client).order_by(*LATEST_ORDERING)
+        return readings.recent().first() or readings.first()
+
+    def latest_per_well(self, profile_clients):
+        """Newest reading of each well in ``profile_clients``, one index probe per well."""
+        profile_clients = {getattr(profile_client, 'pk', profile_client) for profile_client in profile_clients}
+        readings = list(self.recent()._latest_per_well(profile_clients))
+        missing = profile_clients - {reading.profile_client_id for reading in readings}
+        if missing:
+            readings.extend(self._latest_per_well(missing))
+        return readings
+
+    async def alatest_per_well(self, profile_clients):
+        """``latest_per_well`` for async views."""
+        profile_clients = {getattr(profile_client, 'pk', profile_client) for profile_client in profile_clients}
+        readings = [reading async for reading in self.recent()._latest_per_well(profile_clients)]
+        missing = profile_clients - {reading.profile_client_id for reading in readings}
+        if missing:
+            readings.extend([reading async for reading in self._latest_per_well(missing)])
+        return readings
+
+    def _latest_per_well(self, profile_clients):
+        latest = self.filter(
+            profile_client=OuterRef('pk')
+        ).order_by(*LATEST_ORDERING).values('pk')[:1]
+        latest_ids = ProfileClient.objects.filter(
+            pk__in=profile_clients
+        ).annotate(latest_id=Subquery(latest)).values('latest_id')
+        return self.filter(pk__in=Subquery(latest_ids))
+
+
 class InteractionDetail(ModelApi):
+    # La tabla esta particionada por mes sobre date_time_medition (ver api.crm.partitions),
+    # la llave primaria real es (id, date_time_medition).
     profile_client = models.ForeignKey(ProfileClient, blank=True, null=True, on_delete=models.CASCADE)
-    date_time_medition = models.DateTimeField(max_length=800, blank=True, null=True)
-    flow = models.CharField(max_length=400, blank=True, null=True)
-    total = models.CharField(max_length=400, blank=True, null=True)
-    nivel = models.CharField(max_length=400, blank=True, null=True)
+    date_time_medition = models.DateTimeField(max_length=800, blank=True, default=timezone.now)
+    flow = models.FloatField(blank=True, null=True)
+    total = models.BigIntegerField(blank=True, null=True)
+    nivel = models.FloatField(blank=True, null=True)
     is_send_dga = models.BooleanField(default=False)
     soap_return = models.TextField(max_length=3000, blank=True, null=True)
-    
+
+    objects = InteractionDetailQuerySet.as_manager()
+
+    class Meta(ModelApi.Meta):
+        indexes = [
+            models.Index(fields=['profile_client', '-created', '-modified'], name='crm_interaction_latest_idx'),
+            # Paginacion por cursor (ver api/crm/pagination.py) y filtros por fecha (api/crm/filters.py).
+            models.Index(fields=['profile_client', '-date_time_medition', '-id'], name='crm_interaction_keyset_idx'),
+            models.Index(fields=['-date_time_medition', '-id'], name='crm_interaction_dtm_idx'),
+        ]
+        constraints = [
+            # Una lectura por pozo y hora de medicion; incluye la llave de particion.
+            models.UniqueConstraint(fields=['profile_client', 'date_time_medition'], name='crm_interaction_reading_uniq'),
+        ]
 
     def __str__(self):
         return str(self.profile_client)
@@ -0,0 +1,41 @@
+"""Monthly XLSX reports built in the background."""
+
+from django.db import models
+from .utils import ModelApi
+from .client_profile import ProfileClient
+
+
+class ReportExport(ModelApi):
+    """Monthly report of one well (see ``api/crm/reports.py``)."""
+
+    PENDING = 'PENDING'
+    RUNNING = 'RUNNING'
+    DONE = 'DONE'
+    FAILED = 'FAILED'
+    statuses = [
+        (PENDING, 'pending'),
+        (RUNNING, 'running'),
+        (DONE, 'done'),
+        (FAILED, 'failed'),
+    ]
+
+    profile_client = models.ForeignKey(ProfileClient, related_name='reports', on_delete=models.CASCADE)
+    # Primer dia del mes.
+    month = models.DateField()
+    status = models.CharField(max_length=10, choices=statuses, default=PENDING)
+    file = models.FileField(upload_to='reports/', blank=True, null=True)
+    # sha256 de las filas del reporte; un reporte sin cambios no se reescribe.
+    content_hash = models.CharField(max_length=64, blank=True, null=True)
+    # Filas y ultima modificacion del mes al construirlo; si cambian, el reporte esta desactualizado.
+    watermark = models.CharField(max_length=64, blank=True, null=True)
+    rows = models.IntegerField(default=0)
+    # Construido con el mes ya cerrado: se reutiliza sin volver a revisar.
+    is_closed = models.BooleanField(default=False)
+    built_at = models.DateTimeField(blank=True, null=True)
+    error = models.TextField(blank=True, null=True)
+
+    class Meta(ModelApi.Meta):
+        unique_together = [('profile_client', 'month')]
+
+    def __str__(self):
+        return '{} {}'.format(self.profile_client_id, self.month.strftime('%Y-%m'))
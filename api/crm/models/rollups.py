@@ -0,0 +1,87 @@
+"""Daily and monthly rollups of the well readings."""
+
+from django.db import models
+from .utils import ModelApi
+from .client_profile import ProfileClient
+
+
+class ReadingRollup(ModelApi):
+    """Aggregates of the readings of one well in one period."""
+
+    first_reading_at = models.DateTimeField(blank=True, null=True)
+    last_reading_at = models.DateTimeField(blank=True, null=True)
+    total_start = models.BigIntegerField(blank=True, null=True)
+    total_end = models.BigIntegerField(blank=True, null=True)
+    # total_end menos el ultimo totalizador antes del periodo (total_start), o el primero del periodo.
+    volume = models.BigIntegerField(default=0)
+    flow_min = models.FloatField(blank=True, null=True)
+    flow_max = models.FloatField(blank=True, null=True)
+    flow_sum = models.FloatField(default=0)
+    flow_count = models.IntegerField(default=0)
+    nivel_sum = models.FloatField(default=0)
+    nivel_count = models.IntegerField(default=0)
+    samples = models.IntegerField(default=0)
+
+    class Meta(ModelApi.Meta):
+        abstract = True
+
+    @property
+    def flow_avg(self):
+        if not self.flow_count:
+            return None
+        return self.flow_sum / self.flow_count
+
+    @property
+    def nivel_avg(self):
+        if not self.nivel_count:
+            return None
+        return self.nivel_sum / self.nivel_count
+
+    def add(self, date_time_medition, flow, total, nivel, previous_total=None):
+        """Add one reading; ``previous_total`` is the totalizer before it."""
+        self.samples += 1
+        if self.first_reading_at is None or date_time_medition < self.first_reading_at:
+            self.first_reading_at = date_time_medition
+        if self.last_reading_at is None or date_time_medition > self.last_reading_at:
+            self.last_reading_at = date_time_medition
+
+        if flow is not None:
+            self.flow_sum += flow
+            self.flow_count += 1
+            self.flow_min = flow if self.flow_min is None else min(self.flow_min, flow)
+            self.flow_max = flow if self.flow_max is None else max(self.flow_max, flow)
+
+        if nivel is not None:
+            self.nivel_sum += nivel
+            self.nivel_count += 1
+
+        if total is not None:
+            if self.total_start is None:
+                self.total_start = previous_total if previous_total is not None else total
+            self.total_end = total
+            self.volume = self.total_end - self.total_start
+
+
+class InteractionDaily(ReadingRollup):
+    profile_client = models.ForeignKey(ProfileClient, related_name='daily_rollups', on_delete=models.CASCADE)
+    day = models.DateField()
+
+    class Meta(ReadingRollup.Meta):
+        ordering = ['-day']
+        unique_together = [('profile_client', 'day')]
+
+    def __str__(self):
+        return '{} {}'.format(self.profile_client_id, self.day)
+
+
+class InteractionMonthly(ReadingRollup):
+    profile_client = models.ForeignKey(ProfileClient, related_name='monthly_rollups', on_delete=models.CASCADE)
+    # Primer dia del mes.
+    month = models.DateField()
+
+    class Meta(ReadingRollup.Meta):
+        ordering = ['-month']
+        unique_together = [('profile_client', 'month')]
+
+    def __str__(self):
+        return '{} {}'.format(self.profile_client_id, self.month)
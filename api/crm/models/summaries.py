@@ -0,0 +1,36 @@
+"""Precomputed per-well statistics for the fleet overview."""
+
+from django.db import models
+from django.db.models import F
+from .utils import ModelApi
+from .client_profile import ProfileClient
+
+
+class WellSummary(ModelApi):
+    """Latest state of one well, refreshed by ingestion and the DGA sender (see ``api/crm/summaries.py``)."""
+
+    profile_client = models.OneToOneField(ProfileClient, related_name='summary', on_delete=models.CASCADE)
+    last_reading_at = models.DateTimeField(blank=True, null=True)
+    last_flow = models.FloatField(blank=True, null=True)
+    last_total = models.BigIntegerField(blank=True, null=True)
+    last_nivel = models.FloatField(blank=True, null=True)
+    # Primer dia del mes de los campos month_*.
+    month = models.DateField(blank=True, null=True)
+    month_volume = models.BigIntegerField(default=0)
+    month_flow_avg = models.FloatField(blank=True, null=True)
+    month_flow_max = models.FloatField(blank=True, null=True)
+    # flow_granted_dga del pozo como numero.
+    flow_granted = models.FloatField(blank=True, null=True)
+    over_granted = models.BooleanField(default=False)
+    dga_sent_at = models.DateTimeField(blank=True, null=True)
+    dga_ok = models.BooleanField(blank=True, null=True)
+    dga_response = models.TextField(blank=True, null=True)
+
+    class Meta(ModelApi.Meta):
+        indexes = [
+            # Vista de flota: primero los pozos sin lecturas y luego los menos recientes.
+            models.Index(F('last_reading_at').asc(nulls_first=True), F('id'), name='crm_summary_freshness_idx'),
+        ]
+
+    def __str__(self):
+        return str(self.profile_client_id)
@@ -0,0 +1,157 @@
+"""Pagination of the readings."""
+
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from datetime import datetime
+
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from api.crm.columnar import wants_columns
+
+
+def estimate_count(queryset):
+    """Row count estimated by the planner, without scanning the table."""
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPagination(BasePagination):
+    """Keyset pagination on ``(date_time_medition, id)``, newest first; ``count=true|estimate`` adds a total."""
+
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = 1000
+    # Con ?layout=columns las filas son mucho mas livianas.
+    columnar_max_page_size = 10000
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    count_query_param = 'count'
+    invalid_cursor_message = 'Cursor invalido.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = self.get_count(queryset, request)
+        return self.set_page(list(self.page_queryset(queryset, request)))
+
+    def page_queryset(self, queryset, request):
+        """The slice of ``queryset`` holding the page (one row more, to detect the next one)."""
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+
+        self.cursor = self.decode_cursor(request)
+        self.reverse = self.cursor is not None and self.cursor[0]
+        if self.cursor is None:
+            queryset = queryset.order_by('-date_time_medition', '-id')
+        elif self.reverse:
+            _, date_time_medition, pk = self.cursor
+            queryset = queryset.filter(
+                Q(date_time_medition__gt=date_time_medition) | Q(date_time_medition=date_time_medition, id__gt=pk)
+            ).order_by('date_time_medition', 'id')
+        else:
+            _, date_time_medition, pk = self.cursor
+            queryset = queryset.filter(
+                Q(date_time_medition__lt=date_time_medition) | Q(date_time_medition=date_time_medition, id__lt=pk)
+            ).order_by('-date_time_medition', '-id')
+        return queryset[:self.page_size + 1]
+
+    def set_page(self, rows):
+        """Page of the rows read from ``page_queryset``."""
+        has_more = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        if self.reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            cutoff = self.columnar_max_page_size if wants_columns(request) else self.max_page_size
+            return _positive_int(request.query_params[self.page_size_query_param], strict=True, cutoff=cutoff)
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_count(self, queryset, request):
+        count = request.query_params.get(self.count_query_param, '').lower()
+        if count in ('1', 'true'):
+            return queryset.order_by().count()
+        if count == 'estimate':
+            return estimate_count(queryset)
+        return None
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            reverse, date_time_medition, pk = base64.urlsafe_b64decode(encoded.encode('ascii')).decode('ascii').split('|')
+            return reverse == '1', datetime.fromisoformat(date_time_medition), int(pk)
+        except (TypeError, ValueError, UnicodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, reverse, row):
+        cursor = '{}|{}|{}'.format(int(reverse), row.date_time_medition.isoformat(), row.id)
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, base64.urlsafe_b64encode(cursor.encode('ascii')).decode('ascii')
+        )
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(False, self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return replace_query_param(self.base_url, self.cursor_query_param, '')
+        return self.encode_cursor(True, self.page[0])
+
+    def get_paginated_data(self, data):
+        response = OrderedDict()
+        if self.count is not None:
+            response['count'] = self.count
+        response['next'] = self.get_next_link()
+        response['previous'] = self.get_previous_link()
+        response['results'] = data
+        return response
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+
+class InteractionPagination(PageNumberPagination):
+    """Page numbers as before; keyset pages when the request sends ``cursor`` (empty for the first)."""
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if KeysetPagination.cursor_query_param in request.query_params:
+            self.keyset = KeysetPagination()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class FleetPagination(PageNumberPagination):
+    """Large pages for the fleet overview."""
+
+    page_size = 500
+    page_size_query_param = 'page_size'
+    max_page_size = 5000
@@ -0,0 +1,42 @@
+"""Request parsers."""
+
+import codecs
+import csv
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.settings import api_settings
+
+
+class CSVParser(BaseParser):
+    """``text/csv`` with a header row, parsed to a list of dicts (empty cells are ``None``)."""
+
+    media_type = 'text/csv'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            reader = csv.DictReader(codecs.getreader(encoding)(stream))
+            return [
+                {name.strip(): value if value != '' else None for name, value in row.items() if name}
+                for row in reader
+            ]
+        except (csv.Error, UnicodeDecodeError) as e:
+            raise ParseError('CSV invalido: {}'.format(e))
+
+
+class StreamJSONParser(BaseParser):
+    """JSON read from the stream, without the ``DATA_UPLOAD_MAX_MEMORY_SIZE`` limit of ``request.body``."""
+
+    media_type = 'application/json'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            return json.load(codecs.getreader(encoding)(stream), strict=api_settings.STRICT_JSON)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ParseError('JSON invalido: {}'.format(e))
@@ -0,0 +1,124 @@
+"""Monthly partitions of crm_interactiondetail."""
+
+import re
+from datetime import datetime
+
+import pytz
+from django.conf import settings
+from django.db import connection, transaction
+
+
+TABLE = 'crm_interactiondetail'
+DEFAULT_PARTITION = TABLE + '_default'
+PARTITION_NAME = re.compile(r'^crm_interactiondetail_y(\d{4})m(\d{2})$')
+
+
+def add_months(year, month, months):
+    index = year * 12 + month - 1 + months
+    return index // 12, index % 12 + 1
+
+
+def month_start(year, month):
+    return pytz.timezone(settings.TIME_ZONE).localize(datetime(year, month, 1))
+
+
+def month_bounds(year, month):
+    return month_start(year, month), month_start(*add_months(year, month, 1))
+
+
+def partition_name(year, month):
+    return '{}_y{:04d}m{:02d}'.format(TABLE, year, month)
+
+
+def current_month():
+    now = datetime.now(pytz.timezone(settings.TIME_ZONE))
+    return now.year, now.month
+
+
+def list_partitions():
+    """Return ``[(name, year, month, is_attached, estimated_rows)]`` by month."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname, i.inhrelid IS NOT NULL, c.reltuples::bigint
+            FROM pg_class c
+            LEFT JOIN pg_inherits i ON i.inhrelid = c.oid AND i.inhparent = %s::regclass
+            WHERE c.relkind = 'r' AND c.relname LIKE %s
+            """,
+            [TABLE, TABLE + '_y%'],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, is_attached, estimated_rows in rows:
+        match = PARTITION_NAME.match(name)
+        if match:
+            year, month = int(match.group(1)), int(match.group(2))
+            partitions.append((name, year, month, is_attached, max(estimated_rows, 0)))
+    return sorted(partitions, key=lambda partition: (partition[1], partition[2]))
+
+
+def create_partition(year, month):
+    """Create and attach the partition of a month, moving its rows out of the default partition."""
+    name = partition_name(year, month)
+    start, end = month_bounds(year, month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute('CREATE TABLE {} (LIKE {})'.format(name, TABLE))
+        cursor.execute(
+            """
+            WITH moved AS (
+                DELETE FROM {default} WHERE date_time_medition >= %s AND date_time_medition < %s
+                RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved
+            """.format(default=DEFAULT_PARTITION, name=name),
+            [start, end],
+        )
+        cursor.execute(
+            'ALTER TABLE {} ATTACH PARTITION {} FOR VALUES FROM (%s) TO (%s)'.format(TABLE, name),
+            [start, end],
+        )
+    return name
+
+
+def ensure_partitions(ahead=3):
+    """Create the partitions from the current month to ``ahead`` months later."""
+    existing = {(year, month) for _, year, month, _, _ in list_partitions()}
+    created = []
+    year, month = current_month()
+    for offset in range(ahead + 1):
+        key = add_months(year, month, offset)
+        if key not in existing:
+            created.append(create_partition(*key))
+    return created
+
+
+def detach_partitions(older_than):
+    """Detach, as plain tables, the partitions ending ``older_than`` months ago."""
+    limit = add_months(*current_month(), -older_than)
+    detached = []
+    for name, year, month, is_attached, _ in list_partitions():
+        if is_attached and (year, month) < limit:
+            with connection.cursor() as cursor:
+                cursor.execute('ALTER TABLE {} DETACH PARTITION {}'.format(TABLE, name))
+            detached.append(name)
+    return detached
+
+
+def attach_partition(name):
+    """Attach again a partition detached with ``detach_partitions``."""
+    match = PARTITION_NAME.match(name)
+    if not match:
+        raise ValueError('Nombre de particion invalido: {}'.format(name))
+    start, end = month_bounds(int(match.group(1)), int(match.group(2)))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'ALTER TABLE {} ATTACH PARTITION {} FOR VALUES FROM (%s) TO (%s)'.format(TABLE, name),
+            [start, end],
+        )
+    return name
+
+
+def main():
+    for name in ensure_partitions():
+        print('Particion creada', name)
@@ -8,4 +8,10 @@ class IsAccountOwner(BasePermission):
 
 	def has_object_permission(self, request, view, obj):
 		"""Check obj and user are the same."""
-		return request.user == obj
\ No newline at end of file
+		return request.user == obj
+
+class IsAdminView(BasePermission):
+	"""Allow access only to users with ``is_admin_view``."""
+
+	def has_permission(self, request, view):
+		return bool(request.user and request.user.is_authenticated and request.user.is_admin_view)
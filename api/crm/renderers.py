@@ -0,0 +1,56 @@
+"""Optional binary and fast JSON renderers (orjson, msgpack)."""
+
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def encode_default(value):
+    """Types DRF's JSON encoder knows about (dates, decimals, uuids...)."""
+    return JSONEncoder().default(value)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """The same JSON encoded with orjson; chosen with ``?format=orjson``."""
+
+    media_type = 'application/json'
+    format = 'orjson'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=encode_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """MessagePack, chosen with ``Accept: application/msgpack`` or ``?format=msgpack``."""
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
+
+
+def reading_renderers():
+    """Renderers of the reading endpoints: JSON first, then the installed extras."""
+    renderers = [JSONRenderer, BrowsableAPIRenderer]
+    if orjson is not None:
+        renderers.append(ORJSONRenderer)
+    if msgpack is not None:
+        renderers.append(MessagePackRenderer)
+    return renderers
@@ -0,0 +1,150 @@
+"""Monthly XLSX reports of the wells, built outside the request path."""
+
+import hashlib
+import tempfile
+from datetime import timedelta
+
+from django.core.files import File
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from api.crm.exports import INTERACTION_IGNORE_HEADERS, INTERACTION_TITLES, write_xlsx, xlsx_columns
+from api.crm.models import InteractionDetail, ReportExport
+from api.crm.partitions import current_month, month_bounds
+from api.crm.serializers import InteractionDetailModelSerializer
+
+
+# Un trabajo en ejecucion por mas tiempo que esto se considera abandonado.
+RUNNING_TIMEOUT = timedelta(hours=1)
+
+
+def report_columns():
+    return xlsx_columns(InteractionDetailModelSerializer(), INTERACTION_IGNORE_HEADERS)
+
+
+def month_readings(profile_client_id, month):
+    """Readings of the report, same rows and order as the XLS download."""
+    start, end = month_bounds(month.year, month.month)
+    return InteractionDetail.objects.filter(
+        profile_client_id=profile_client_id, date_time_medition__gte=start, date_time_medition__lt=end
+    ).order_by('-created', '-modified')
+
+
+def content_hash(queryset, columns):
+    digest = hashlib.sha256()
+    rows = 0
+    for values in queryset.values_list(*[field.source for _, field in columns]).iterator(chunk_size=2000):
+        digest.update(repr(values).encode('utf-8'))
+        rows += 1
+    return digest.hexdigest(), rows
+
+
+def month_watermark(profile_client_id, month):
+    """Rows and newest ``modified`` of the month: changes on every insert, edit or delete."""
+    # Las ediciones (API, admin, carga masiva) actualizan modified.
+    values = month_readings(profile_client_id, month).order_by().aggregate(rows=Count('id'), newest=Max('modified'))
+    newest = values['newest'].isoformat() if values['newest'] else '-'
+    return '{}:{}'.format(values['rows'], newest)
+
+
+def is_closed_month(month):
+    return (month.year, month.month) < current_month()
+
+
+def is_stale(report):
+    # Un reporte construido con el mes cerrado se reutiliza; el del mes en curso se compara con la marca.
+    if report.is_closed:
+        return False
+    if is_closed_month(report.month):
+        return True
+    return month_watermark(report.profile_client_id, report.month) != report.watermark
+
+
+def reports_changed(months):
+    """Mark stale the reports of ``{(profile_client_id, first day of month)}``, closed ones included."""
+    wells = {}
+    for profile_client_id, month in months:
+        wells.setdefault(profile_client_id, set()).add(month)
+    if not wells:
+        return 0
+    condition = Q()
+    for profile_client_id, well_months in wells.items():
+        condition |= Q(profile_client_id=profile_client_id, month__in=well_months)
+    return ReportExport.objects.filter(condition, is_closed=True).update(is_closed=False, modified=timezone.now())
+
+
+def request_report(profile_client_id, month):
+    """Report of the well for ``month``; queued for building when not ready."""
+    report, _ = ReportExport.objects.get_or_create(
+        profile_client_id=profile_client_id, month=month.replace(day=1)
+    )
+    if report.status == ReportExport.DONE and report.file and not is_stale(report):
+        return report
+    if report.status not in (ReportExport.PENDING, ReportExport.RUNNING):
+        report.status = ReportExport.PENDING
+        report.modified = timezone.now()
+        report.save(update_fields=['status', 'modified'])
+    return report
+
+
+def build_report(report):
+    """Write the XLSX of a report, unless its rows did not change."""
+    columns = report_columns()
+    closed = is_closed_month(report.month)
+    queryset = month_readings(report.profile_client_id, report.month)
+    # Antes de leer las filas: una escritura durante la construccion deja el reporte desactualizado.
+    watermark = month_watermark(report.profile_client_id, report.month)
+    digest, rows = content_hash(queryset, columns)
+
+    if digest != report.content_hash or not report.file:
+        old_name = report.file.name if report.file else None
+        with tempfile.TemporaryFile() as file:
+            write_xlsx(file, queryset, columns, INTERACTION_TITLES)
+            file.seek(0)
+            report.file.save(
+                '{}/{}-{}.xlsx'.format(report.profile_client_id, report.month.strftime('%Y-%m'), digest[:12]),
+                File(file), save=False
+            )
+        if old_name and old_name != report.file.name:
+            report.file.storage.delete(old_name)
+
+    report.content_hash = digest
+    report.watermark = watermark
+    report.rows = rows
+    report.is_closed = closed
+    report.status = ReportExport.DONE
+    report.built_at = report.modified = timezone.now()
+    report.error = None
+    report.save()
+    return report
+
+
+def next_job():
+    with transaction.atomic():
+        report = ReportExport.objects.select_for_update(skip_locked=True).filter(
+            status=ReportExport.PENDING
+        ).order_by('modified').first()
+        if report is not None:
+            report.status = ReportExport.RUNNING
+            report.modified = timezone.now()
+            report.save(update_fields=['status', 'modified'])
+        return report
+
+
+def main():
+    ReportExport.objects.filter(
+        status=ReportExport.RUNNING, modified__lt=timezone.now() - RUNNING_TIMEOUT
+    ).update(status=ReportExport.PENDING)
+
+    report = next_job()
+    while report is not None:
+        try:
+            build_report(report)
+            print(report, 'filas=', report.rows)
+        except Exception as e:
+            report.status = ReportExport.FAILED
+            report.error = str(e)
+            report.save(update_fields=['status', 'error'])
+            print(report, e)
+        report = next_job()
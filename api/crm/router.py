@@ -10,6 +10,10 @@ from rest_framework.routers import DefaultRouter
 from api.crm.views import users as views_users
 from api.crm.views import client_profile as views_clientp
 from api.crm.views import interaction_detail as views_detail
+from api.crm.views import rollups as views_rollups
+from api.crm.views import reports as views_reports
+from api.crm.views import dashboard as views_dashboard
+from api.crm.views import fleet as views_fleet
 
 router = DefaultRouter()
 
@@ -19,6 +23,11 @@ router.register(r'client_profile', views_clientp.ClientProfileViewSet, basename=
 router.register(r'history_data', views_clientp.DataHistoryFactViewSet, basename= 'history_data')
 router.register(r'interaction_detail', views_detail.InteractionXLS)
 router.register(r'interaction_detail_json', views_detail.InteractionDetailViewSet, basename= 'interaction_detail_json')
+router.register(r'interaction_daily', views_rollups.InteractionDailyViewSet, basename= 'interaction_daily')
+router.register(r'interaction_monthly', views_rollups.InteractionMonthlyViewSet, basename= 'interaction_monthly')
+router.register(r'report_export', views_reports.ReportExportViewSet, basename= 'report_export')
+router.register(r'dashboard', views_dashboard.DashboardViewSet, basename= 'dashboard')
+router.register(r'fleet', views_fleet.FleetViewSet, basename= 'fleet')
 
 
 urlpatterns = [
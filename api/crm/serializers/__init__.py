@@ -2,5 +2,8 @@ from .users import UserProfile ,UserModelSerializer, UserLoginSerializer, UserSi
 from .client_profile import  (ProfileClientSerializer, RegisterPersons,
         InteractionDetailSerializer, DataHistoryFact, RetrieveProfileClientSerializer,
         CronProfileClientSerializer)
-from .interaction_detail import InteractionDetailModelSerializer
+from .interaction_detail import InteractionDetailModelSerializer, ReadingAggregateSerializer
 
+from .rollups import InteractionDailySerializer, InteractionMonthlySerializer
+from .reports import ReportExportSerializer, ReportRequestSerializer
+from .summaries import WellSummarySerializer
@@ -2,6 +2,9 @@
 # Django REST Framework
 from rest_framework import serializers
 from .users import UserInfoModelSerializer
+from .interaction_detail import NumericStringFieldsMixin
+from api.crm.cache import get_last_data as cached_last_data
+from api.crm.sparse_fields import SparseFieldsMixin
 
 # Models
 from api.crm.models import (
@@ -23,26 +26,32 @@ class VariableClientModelSerializer(serializers.ModelSerializer):
           model = VariableClient
           fields = "__all__"
 
-class RetrieveProfileClientSerializer(serializers.ModelSerializer):
+class RetrieveProfileClientSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     variables = serializers.SerializerMethodField('get_variables')
     user = UserInfoModelSerializer()
     last_data = serializers.SerializerMethodField('get_last_data')
 
     def get_variables(self, profile):
-        qs = VariableClient.objects.filter(profile=profile)
+        # Usa las variables precargadas cuando vienen con prefetch_related('variable_profile').
+        qs = profile.variable_profile.all()
         serializer = VariableClientModelSerializer(instance=qs, many=True)
         return serializer.data
 
     def get_last_data(self, profile):
-        qs = InteractionDetail.objects.filter(profile_client=profile).first()
-        serializer = InteractionDetailSerializer(instance=qs, many=False)
-        return serializer.data
+        # Las vistas async pasan las ultimas lecturas ya leidas en el contexto.
+        if 'last_data' in self.context:
+            return self.context['last_data'][profile.id]
+        def compute():
+            qs = InteractionDetail.objects.latest_for(profile)
+            serializer = InteractionDetailSerializer(instance=qs, many=False)
+            return serializer.data
+        return cached_last_data(profile.id, compute)
 
     class Meta:
         model = ProfileClient
         fields = "__all__"
 
-class ProfileClientSerializer(serializers.ModelSerializer):
+class ProfileClientSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ProfileClient
         fields = "__all__"
@@ -51,7 +60,8 @@ class CronProfileClientSerializer(serializers.ModelSerializer):
     variables = serializers.SerializerMethodField('get_variables')
 
     def get_variables(self, profile):
-        qs = VariableClient.objects.filter(profile=profile)
+        # Usa las variables precargadas por ingestion.wells.load_wells
+        qs = profile.variable_profile.all()
         serializer = VariableClientModelSerializer(instance=qs, many=True)
         return serializer.data
 
@@ -70,7 +80,7 @@ class DataHistoryFact(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class InteractionDetailSerializer(serializers.ModelSerializer):
+class InteractionDetailSerializer(NumericStringFieldsMixin, serializers.ModelSerializer):
     interaction = InteractionDetail()
 
     class Meta:
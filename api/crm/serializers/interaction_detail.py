@@ -1,8 +1,91 @@
+import math
+
+from datetime import timedelta
+
 from rest_framework import serializers
+from api.crm.aggregates import BUCKETS, DEFAULT_METRICS, METRICS
+from api.crm.downsampling import MAX_POINTS, DownsampleSerializer
 from api.crm.models import InteractionDetail
+from api.crm.sparse_fields import SparseFieldsMixin
+
+
+class NumericStringField(serializers.Field):
+    """Numeric column rendered as text, the JSON shape of the old CharFields."""
+
+    default_error_messages = {
+        'invalid': 'Se requiere un numero valido.'
+    }
+
+    def __init__(self, cast=float, **kwargs):
+        self.cast = cast
+        kwargs.setdefault('required', False)
+        kwargs.setdefault('allow_null', True)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('invalid')
+        try:
+            number = float(data)
+        except (TypeError, ValueError):
+            self.fail('invalid')
+        if not math.isfinite(number):
+            self.fail('invalid')
+        return self.cast(number)
+
+    def to_representation(self, value):
+        return str(value)
+
+
+class NumericStringFieldsMixin:
+    """Build flow/total/nivel as NumericStringField keeping the field order."""
 
+    numeric_string_fields = {
+        'flow': float,
+        'total': int,
+        'nivel': float,
+    }
 
-class InteractionDetailModelSerializer(serializers.ModelSerializer):
+    def build_standard_field(self, field_name, model_field):
+        if field_name in self.numeric_string_fields:
+            return NumericStringField, {'cast': self.numeric_string_fields[field_name]}
+        return super().build_standard_field(field_name, model_field)
+
+
+class InteractionDetailModelSerializer(SparseFieldsMixin, NumericStringFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = InteractionDetail
         fields = '__all__'
+
+
+class ReadingAggregateSerializer(DownsampleSerializer):
+    """Query params of the aggregate action."""
+
+    max_hourly_days = 93
+
+    max_points = serializers.IntegerField(min_value=3, max_value=MAX_POINTS, required=False)
+
+    profile_client = serializers.IntegerField()
+    bucket = serializers.ChoiceField(choices=BUCKETS, default='day')
+    start = serializers.DateField()
+    end = serializers.DateField()
+    metrics = serializers.CharField(required=False)
+
+    def validate_metrics(self, value):
+        metrics = [metric.strip() for metric in value.split(',') if metric.strip()]
+        unknown = [metric for metric in metrics if metric not in METRICS]
+        if unknown or not metrics:
+            raise serializers.ValidationError(
+                'Metricas validas: {}.'.format(', '.join(METRICS))
+            )
+        return list(dict.fromkeys(metrics))
+
+    def validate(self, data):
+        if data['start'] > data['end']:
+            raise serializers.ValidationError('start debe ser anterior a end.')
+        if data['bucket'] == 'hour' and data['end'] - data['start'] >= timedelta(days=self.max_hourly_days):
+            raise serializers.ValidationError(
+                'El rango por hora no puede superar {} dias.'.format(self.max_hourly_days)
+            )
+        data.setdefault('metrics', list(DEFAULT_METRICS))
+        return data
@@ -0,0 +1,24 @@
+from datetime import date
+
+from rest_framework import serializers
+from api.crm.models import ReportExport
+
+
+class ReportExportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ReportExport
+        fields = ('id', 'profile_client', 'month', 'status', 'file', 'rows',
+                  'is_closed', 'built_at', 'error', 'created')
+        read_only_fields = fields
+
+
+class ReportRequestSerializer(serializers.Serializer):
+    """Query params of the monthly report request."""
+
+    profile_client = serializers.IntegerField()
+    year = serializers.IntegerField(min_value=2000, max_value=9999)
+    month = serializers.IntegerField(min_value=1, max_value=12)
+
+    def validate(self, data):
+        data['month'] = date(data['year'], data['month'], 1)
+        return data
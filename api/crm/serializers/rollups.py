@@ -0,0 +1,20 @@
+from rest_framework import serializers
+from api.crm.models import InteractionDaily, InteractionMonthly
+
+
+class InteractionDailySerializer(serializers.ModelSerializer):
+    flow_avg = serializers.FloatField(read_only=True)
+    nivel_avg = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = InteractionDaily
+        exclude = ('flow_sum', 'nivel_sum', 'nivel_count')
+
+
+class InteractionMonthlySerializer(serializers.ModelSerializer):
+    flow_avg = serializers.FloatField(read_only=True)
+    nivel_avg = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = InteractionMonthly
+        exclude = ('flow_sum', 'nivel_sum', 'nivel_count')
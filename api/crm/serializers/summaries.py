@@ -0,0 +1,29 @@
+from django.utils import timezone
+from rest_framework import serializers
+
+from api.crm.models import WellSummary
+
+
+class WellSummarySerializer(serializers.ModelSerializer):
+    title = serializers.CharField(source='profile_client.title', read_only=True)
+    code_dga_site = serializers.CharField(source='profile_client.code_dga_site', read_only=True)
+    user = serializers.CharField(source='profile_client.user.email', read_only=True)
+    is_dga = serializers.BooleanField(source='profile_client.is_dga', read_only=True)
+    freshness = serializers.SerializerMethodField()
+    month_volume = serializers.SerializerMethodField()
+
+    class Meta:
+        model = WellSummary
+        exclude = ('id', 'created')
+
+    def get_freshness(self, summary):
+        """Seconds since the last reading."""
+        if summary.last_reading_at is None:
+            return None
+        return int((timezone.now() - summary.last_reading_at).total_seconds())
+
+    def get_month_volume(self, summary):
+        # Sin lecturas desde el cambio de mes el volumen del mes es 0.
+        if summary.month != timezone.localdate().replace(day=1):
+            return 0
+        return summary.month_volume
@@ -0,0 +1,49 @@
+"""Cache and summary upkeep when wells, readings or tokens change outside the cron jobs."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from api.crm.authentication import forget_tokens, forget_user_tokens
+from api.crm.cache import readings_changed
+from api.crm.models import InteractionDetail, ProfileClient, User, VariableClient
+from api.crm.summaries import refresh_summaries
+
+
+@receiver([post_save, post_delete], sender=ProfileClient)
+def profile_client_changed(sender, instance, **kwargs):
+    readings_changed([instance.pk])
+
+
+@receiver(post_save, sender=ProfileClient)
+def profile_client_saved(sender, instance, **kwargs):
+    # flow_granted_dga del resumen de flota.
+    refresh_summaries([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=VariableClient)
+def variable_client_changed(sender, instance, **kwargs):
+    readings_changed([instance.profile_id] if instance.profile_id else [])
+
+
+@receiver([post_save, post_delete], sender=InteractionDetail)
+def interaction_detail_changed(sender, instance, **kwargs):
+    readings_changed([instance.profile_client_id] if instance.profile_client_id else [])
+
+
+@receiver([post_save, post_delete], sender=User)
+def user_changed(sender, instance, update_fields=None, **kwargs):
+    # El login solo actualiza last_login: no cambia lecturas ni credenciales.
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    # Solo las llaves de sus pozos; los listados cacheados toman los datos
+    # del usuario cuando expiran, despues de la siguiente ingesta.
+    wells = list(ProfileClient.objects.filter(user_id=instance.pk).values_list('id', flat=True))
+    readings_changed(wells, payloads=False)
+    # Clave cambiada, usuario desactivado o borrado: su token se vuelve a validar.
+    forget_user_tokens(instance)
+
+
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    forget_tokens([instance.key])
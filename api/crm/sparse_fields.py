@@ -0,0 +1,46 @@
+"""Sparse fieldsets: ``?fields=a,b`` keeps only those fields, ``?omit=a,b`` drops them."""
+
+FIELDS_QUERY_PARAM = 'fields'
+OMIT_QUERY_PARAM = 'omit'
+
+
+def parse_names(request, param):
+    value = request.query_params.get(param)
+    if not value:
+        return None
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+def requested_fields(request):
+    """``(fields, omit)`` name sets of the request, ``None`` when absent."""
+    return parse_names(request, FIELDS_QUERY_PARAM), parse_names(request, OMIT_QUERY_PARAM)
+
+
+class SparseFieldsMixin:
+    """Serializer whose fields follow ``?fields=`` / ``?omit=`` of the request."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None:
+            return
+        fields, omit = requested_fields(request)
+        for name in list(self.fields):
+            if (fields is not None and name not in fields) or (omit is not None and name in omit):
+                self.fields.pop(name)
+
+
+class SparseFieldsViewMixin:
+    """Load only the columns read by the requested fields, plus ``sparse_required_fields``."""
+
+    sparse_required_fields = ('id',)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action not in ('list', 'retrieve') or requested_fields(self.request) == (None, None):
+            return queryset
+        columns = {field.name for field in queryset.model._meta.concrete_fields}
+        sources = {
+            field.source for field in self.get_serializer().fields.values() if field.source in columns
+        }
+        return queryset.only(*sources, *self.sparse_required_fields)
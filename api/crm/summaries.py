@@ -0,0 +1,93 @@
+"""Maintenance of the per-well summary table (``WellSummary``)."""
+
+import re
+
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from api.crm.models import InteractionDetail, InteractionMonthly, ProfileClient, WellSummary
+
+
+READING_FIELDS = [
+    'last_reading_at', 'last_flow', 'last_total', 'last_nivel', 'month', 'month_volume',
+    'month_flow_avg', 'month_flow_max', 'flow_granted', 'over_granted', 'modified',
+]
+DGA_FIELDS = ['dga_sent_at', 'dga_ok', 'dga_response', 'modified']
+
+NUMBER_RE = re.compile(r'\d+(?:[.,]\d+)?')
+
+
+def parse_flow_granted(value):
+    """First number of ``flow_granted_dga`` ('12,5 l/s' -> 12.5), None without one."""
+    match = NUMBER_RE.search(value or '')
+    return float(match.group().replace(',', '.')) if match else None
+
+
+def refresh_summaries(profile_client_ids=None):
+    """Recompute the reading fields of the wells (all when ``None``) in constant queries."""
+    wells = ProfileClient.objects.only('id', 'flow_granted_dga')
+    if profile_client_ids is not None:
+        wells = wells.filter(pk__in=profile_client_ids)
+    wells = list(wells)
+    ids = [well.id for well in wells]
+    month = timezone.localdate().replace(day=1)
+    now = timezone.now()
+
+    latest = {reading.profile_client_id: reading for reading in InteractionDetail.objects.latest_per_well(ids)}
+    monthly = {
+        rollup.profile_client_id: rollup
+        for rollup in InteractionMonthly.objects.filter(profile_client_id__in=ids, month=month)
+    }
+
+    summaries = []
+    for well in wells:
+        reading = latest.get(well.id)
+        rollup = monthly.get(well.id)
+        flow_granted = parse_flow_granted(well.flow_granted_dga)
+        flow_max = rollup.flow_max if rollup else None
+        summaries.append(WellSummary(
+            profile_client_id=well.id,
+            last_reading_at=reading.date_time_medition if reading else None,
+            last_flow=reading.flow if reading else None,
+            last_total=reading.total if reading else None,
+            last_nivel=reading.nivel if reading else None,
+            month=month,
+            month_volume=rollup.volume if rollup else 0,
+            month_flow_avg=rollup.flow_avg if rollup else None,
+            month_flow_max=flow_max,
+            flow_granted=flow_granted,
+            over_granted=bool(flow_granted and flow_max and flow_max > flow_granted),
+            modified=now,
+        ))
+    WellSummary.objects.bulk_create(
+        summaries, update_conflicts=True, unique_fields=['profile_client'], update_fields=READING_FIELDS
+    )
+    return len(summaries)
+
+
+def record_dga_result(profile_client_id, ok, response):
+    """Store the result of the last DGA send of a well."""
+    now = timezone.now()
+    WellSummary.objects.bulk_create(
+        [WellSummary(profile_client_id=profile_client_id, dga_sent_at=now, dga_ok=ok, dga_response=response, modified=now)],
+        update_conflicts=True, unique_fields=['profile_client'], update_fields=DGA_FIELDS,
+    )
+
+
+def backfill_dga_results():
+    """First load of the ``dga_`` fields from the last reading answered by the DGA of each well."""
+    answered = InteractionDetail.objects.filter(
+        profile_client=OuterRef('profile_client'), soap_return__isnull=False
+    ).order_by('-date_time_medition', '-id')
+    summaries = list(WellSummary.objects.annotate(
+        answered_at=Subquery(answered.values('modified')[:1]),
+        answered_ok=Subquery(answered.values('is_send_dga')[:1]),
+        answered_response=Subquery(answered.values('soap_return')[:1]),
+    ).filter(dga_sent_at__isnull=True, answered_at__isnull=False))
+    for summary in summaries:
+        summary.dga_sent_at = summary.answered_at
+        summary.dga_ok = summary.answered_ok
+        summary.dga_response = summary.answered_response
+        summary.modified = timezone.now()
+    WellSummary.objects.bulk_update(summaries, DGA_FIELDS)
+    return len(summaries)
@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from api.crm.ingestion.bulk import BulkUpsert
+from api.crm.ingestion.wells import load_wells
+from api.crm.models import InteractionDetail, WellSummary
+
+from .utils import create_well
+
+
+def upsert(rows):
+    bulk = BulkUpsert(rows)
+    assert bulk.validate(), bulk.errors
+    bulk.save()
+    return bulk
+
+
+class BulkUpsertTests(TestCase):
+
+    def setUp(self):
+        self.well = create_well()
+        self.hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+
+    def rows(self, total):
+        return [
+            {'profile_client': self.well.id, 'date_time_medition': (self.hour - timedelta(hours=hours)).isoformat(),
+             'total': total + hours, 'flow': 1.5}
+            for hours in range(3)
+        ]
+
+    def test_same_rows_twice_update_in_place(self):
+        first = upsert(self.rows(100))
+        created = dict(InteractionDetail.objects.values_list('date_time_medition', 'created'))
+        second = upsert(self.rows(200))
+
+        self.assertEqual((first.created, first.updated), (3, 0))
+        self.assertEqual((second.created, second.updated), (0, 3))
+        self.assertEqual(
+            sorted(InteractionDetail.objects.values_list('total', flat=True)), [200, 201, 202]
+        )
+        # Las filas actualizadas conservan su created.
+        self.assertEqual(dict(InteractionDetail.objects.values_list('date_time_medition', 'created')), created)
+
+    def test_repeated_key_keeps_the_last_row(self):
+        rows = self.rows(100)[:1] + self.rows(300)[:1]
+        self.assertEqual(upsert(rows).created, 1)
+        self.assertEqual(list(InteractionDetail.objects.values_list('total', flat=True)), [300])
+
+    def test_invalid_rows_are_reported_and_the_rest_saved(self):
+        bulk = BulkUpsert(self.rows(100) + [{'profile_client': self.well.id, 'date_time_medition': 'ayer'}])
+        self.assertFalse(bulk.validate())
+        bulk.save()
+        self.assertEqual(bulk.data['failed'], 1)
+        self.assertEqual(bulk.data['errors'][0]['row'], 3)
+        self.assertEqual(InteractionDetail.objects.count(), 3)
+
+
+class BackfillTests(TestCase):
+
+    def setUp(self):
+        self.well = create_well(is_monitoring=True)
+        self.hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        InteractionDetail.objects.create(
+            profile_client=self.well, date_time_medition=self.hour - timedelta(hours=1), total=1000, flow=2.0
+        )
+
+    def test_backfill_does_not_become_the_latest_reading(self):
+        # Se inserta despues, pero se midio tres dias antes.
+        upsert([{
+            'profile_client': self.well.id,
+            'date_time_medition': (self.hour - timedelta(days=3)).isoformat(),
+            'total': 10, 'flow': 9.0,
+        }])
+
+        self.assertEqual(InteractionDetail.objects.latest_for(self.well).total, 1000)
+        self.assertEqual([reading.total for reading in InteractionDetail.objects.latest_per_well([self.well.id])], [1000])
+        self.assertEqual(load_wells(pk=self.well.id)[0].last_reading.total, 1000)
+        self.assertEqual(WellSummary.objects.get(profile_client=self.well).last_total, 1000)
+
+
+class ReadingDedupMigrationTests(TransactionTestCase):
+    """0083 deletes the repeated readings before adding the unique key."""
+
+    before = [('crm', '0082_well_summary')]
+    after = [('crm', '0083_interactiondetail_reading_unique')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_keeps_the_last_inserted_reading(self):
+        well = create_well()
+        other = create_well('otro@test.cl')
+        self.migrate(self.before)
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        # SQL directo: los modelos y senales actuales suponen el esquema final.
+        with connection.cursor() as cursor:
+            for profile_client_id, date_time_medition, total in [
+                (well.id, hour, 1), (well.id, hour, 2), (well.id, hour, 3),
+                (other.id, hour, 4), (well.id, hour - timedelta(hours=1), 5),
+            ]:
+                cursor.execute(
+                    'INSERT INTO crm_interactiondetail (created, modified, profile_client_id, date_time_medition, total, is_send_dga)'
+                    ' VALUES (now(), now(), %s, %s, %s, false)',
+                    [profile_client_id, date_time_medition, total],
+                )
+
+        self.migrate(self.after)
+
+        self.assertEqual(
+            sorted(InteractionDetail.objects.values_list('profile_client_id', 'total')),
+            sorted([(well.id, 3), (other.id, 4), (well.id, 5)]),
+        )
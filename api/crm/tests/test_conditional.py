@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from api.crm.models import InteractionDetail
+
+from .utils import TEST_CACHES, create_well
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ConditionalRequestTests(TestCase):
+
+    def setUp(self):
+        caches['readings'].clear()
+        self.well = create_well()
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        self.readings = [
+            InteractionDetail.objects.create(
+                profile_client=self.well, date_time_medition=hour - timedelta(hours=hours), flow=1.0
+            )
+            for hours in range(3)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.well.user)
+        self.list_url = '/api/interaction_detail_json/?profile_client={}'.format(self.well.id)
+        self.profile_url = '/api/client_profile/{}/'.format(self.well.id)
+
+    def test_list_answers_304_to_its_etag(self):
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Last-Modified', response)
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_edit_of_an_older_reading_changes_the_etag(self):
+        etag = self.client.get(self.list_url)['ETag']
+        oldest = self.readings[-1]
+        response = self.client.patch('/api/interaction_detail_json/{}/'.format(oldest.id), {'flow': 7.5}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_etag_depends_on_the_format(self):
+        json_etag = self.client.get(self.list_url, HTTP_ACCEPT='application/json')['ETag']
+        html_etag = self.client.get(self.list_url, HTTP_ACCEPT='text/html')['ETag']
+        self.assertNotEqual(json_etag, html_etag)
+
+    def test_missing_reading_is_still_404(self):
+        self.assertEqual(self.client.get('/api/interaction_detail_json/0/').status_code, 404)
+
+    def test_profile_etag_changes_with_a_new_reading(self):
+        response = self.client.get(self.profile_url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertEqual(self.client.get(self.profile_url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        InteractionDetail.objects.create(profile_client=self.well, date_time_medition=timezone.now(), flow=3.0)
+        response = self.client.get(self.profile_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['last_data']['flow'], '3.0')
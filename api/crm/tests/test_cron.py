@@ -0,0 +1,73 @@
+import io
+from contextlib import redirect_stdout
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from django.test import TestCase, override_settings
+
+from api.crm.cron import get_novus_and_save_in_api
+from api.crm.models import InteractionDetail, VariableClient
+
+from .utils import TEST_CACHES, create_well
+
+
+VARIABLES = {'caudal': 'CAUDAL', 'acumulado': 'ACUMULADO', 'nivel': 'NIVEL'}
+
+
+def tagoio(values):
+    return {'status': True, 'result': [{'variable': name, 'value': value} for name, value in values.items()]}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class TagoIOIngestionTests(TestCase):
+    """Wells whose TagoIO variables do not come back fail instead of storing 0."""
+
+    def setUp(self):
+        self.wells = {}
+        for token in ('completo', 'sin-nivel', 'nivel-aparte'):
+            well = self.wells[token] = create_well(token + '@test.cl', is_monitoring=True, scale=1000, token_service=token)
+            for name, type_variable in VARIABLES.items():
+                VariableClient.objects.create(profile=well, str_variable=name, type_variable=type_variable)
+        # Respuesta de cada token a la consulta agrupada y a la de una variable.
+        self.batched = {
+            'completo': tagoio({'caudal': 1.25, 'acumulado': 5000, 'nivel': 3.5}),
+            'sin-nivel': tagoio({'caudal': 2.0, 'acumulado': 6000}),
+            'nivel-aparte': tagoio({'caudal': 3.0, 'acumulado': 7000}),
+        }
+        self.single = {'sin-nivel': tagoio({}), 'nivel-aparte': tagoio({'nivel': 4.5})}
+        self.requests = []
+
+    def fetch_all(self, requests):
+        self.requests.extend(requests)
+        responses = []
+        for request in requests:
+            query = parse_qs(urlsplit(request.url).query)
+            token = request.headers['authorization']
+            responses.append(self.single[token] if 'variable' in query else self.batched[token])
+        return responses
+
+    def run_cron(self):
+        # El cron informa por stdout.
+        with mock.patch('api.crm.cron.Poller.fetch_all', side_effect=self.fetch_all), redirect_stdout(io.StringIO()):
+            return get_novus_and_save_in_api()
+
+    def test_missing_variable_fails_the_well(self):
+        report = self.run_cron()
+
+        readings = {reading.profile_client_id: reading for reading in InteractionDetail.objects.all()}
+        self.assertNotIn(self.wells['sin-nivel'].id, readings)
+        self.assertEqual([profile_client for profile_client, _ in report.errors], [self.wells['sin-nivel'].id])
+        self.assertIn('nivel', report.errors[0][1])
+
+        self.assertEqual(readings[self.wells['completo'].id].nivel, 3.5)
+        self.assertEqual(readings[self.wells['nivel-aparte'].id].nivel, 4.5)
+        self.assertEqual(readings[self.wells['nivel-aparte'].id].total, 7000)
+
+    def test_batched_request_asks_for_the_last_value_of_each_variable(self):
+        self.run_cron()
+        batched = [parse_qs(urlsplit(request.url).query) for request in self.requests[:3]]
+        for query in batched:
+            self.assertEqual(query['query'], ['last_value'])
+            self.assertEqual(sorted(query['variables[]']), sorted(VARIABLES))
+        single = [parse_qs(urlsplit(request.url).query) for request in self.requests[3:]]
+        self.assertEqual(sorted(query['variable'][0] for query in single), ['nivel', 'nivel'])
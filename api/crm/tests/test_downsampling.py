@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from api.crm.downsampling import downsample, downsample_rows, lttb, minmax
+
+
+class LttbTests(SimpleTestCase):
+
+    def setUp(self):
+        self.x = np.arange(1000, dtype=float)
+        self.y = np.sin(self.x / 50)
+        self.y[437] = 40.0
+
+    def test_keeps_threshold_points_with_both_ends(self):
+        selected = lttb(self.x, self.y, 100)
+        self.assertEqual(len(selected), 100)
+        self.assertEqual((selected[0], selected[-1]), (0, 999))
+        self.assertTrue(np.all(np.diff(selected) > 0))
+
+    def test_keeps_the_spike(self):
+        self.assertIn(437, lttb(self.x, self.y, 50))
+
+    def test_short_series_is_not_reduced(self):
+        np.testing.assert_array_equal(lttb(self.x[:10], self.y[:10], 20), np.arange(10))
+
+
+class MinmaxTests(SimpleTestCase):
+
+    def test_keeps_every_bucket_extreme(self):
+        y = np.array([5, 1, 9, 3, 7, 2, 8, 4], dtype=float)
+        np.testing.assert_array_equal(minmax(np.arange(8, dtype=float), y, 4), [1, 2, 5, 6])
+
+    def test_short_series_is_not_reduced(self):
+        np.testing.assert_array_equal(minmax(np.arange(3, dtype=float), np.zeros(3), 4), np.arange(3))
+
+
+class DownsampleTests(SimpleTestCase):
+
+    def setUp(self):
+        start = datetime(2026, 1, 1)
+        self.rows = [
+            {'date_time_medition': start + timedelta(hours=hour),
+             'flow': float(hour % 24), 'nivel': None if hour % 2 else float(hour)}
+            for hour in range(2000)
+        ]
+
+    def test_rows_fit_max_points_and_keep_the_ends(self):
+        kept = downsample_rows(self.rows, 'date_time_medition', ('flow', 'nivel'), 200, get=lambda row, name: row[name])
+        self.assertLessEqual(len(kept), 200)
+        self.assertEqual((kept[0], kept[-1]), (self.rows[0], self.rows[-1]))
+        times = [row['date_time_medition'] for row in kept]
+        self.assertEqual(times, sorted(times))
+
+    def test_missing_values_are_skipped(self):
+        values = [None] * 2000
+        keep = downsample([row['date_time_medition'] for row in self.rows], [values], 100)
+        np.testing.assert_array_equal(keep, [0, 1999])
+
+    def test_minmax_keeps_every_peak(self):
+        flows = [row['flow'] for row in self.rows]
+        keep = downsample([row['date_time_medition'] for row in self.rows], [flows], 200, 'minmax')
+        self.assertLessEqual({0.0, 23.0}, {flows[position] for position in keep})
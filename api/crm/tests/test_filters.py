@@ -0,0 +1,98 @@
+from datetime import date, datetime, timedelta
+
+import pytz
+from django.test import SimpleTestCase, TestCase
+from rest_framework.exceptions import ValidationError
+
+from api.crm.filters import hour_range, local_datetime, measurement_lookups, same_day_in
+from api.crm.models import InteractionDetail
+from api.crm.views.interaction_detail import InteractionDetailViewSet
+
+from .utils import create_well
+
+
+def utc(*args):
+    return pytz.utc.localize(datetime(*args))
+
+
+class MeasurementLookupsTests(SimpleTestCase):
+
+    def test_year_and_month_are_one_half_open_range(self):
+        lookups = measurement_lookups({'year': 2023, 'month': 5})
+        self.assertEqual(lookups, {'range': [(local_datetime(2023, 5), local_datetime(2023, 6))]})
+
+    def test_december_ends_on_the_next_year(self):
+        lookups = measurement_lookups({'year': 2023, 'month': 12})
+        self.assertEqual(lookups['range'], [(local_datetime(2023, 12), local_datetime(2024, 1))])
+
+    def test_month_without_year_stays_a_lookup(self):
+        self.assertEqual(measurement_lookups({'month': 5}), {'month': 5})
+
+    def test_date_range_includes_the_last_day(self):
+        lookups = measurement_lookups({'date__range': (date(2023, 5, 1), date(2023, 5, 3))})
+        self.assertEqual(lookups['range'], [(local_datetime(2023, 5, 1), local_datetime(2023, 5, 4))])
+
+    def test_impossible_date_raises(self):
+        with self.assertRaises(ValueError):
+            measurement_lookups({'year': 2023, 'month': 2, 'day': 30})
+
+    def test_day_when_dst_ends_has_25_hours(self):
+        # 2026-04-05 00:00 -03 vuelve a 2026-04-04 23:00 -04.
+        (start, end), = measurement_lookups({'date': date(2026, 4, 4)})['range']
+        self.assertEqual((start, end), (utc(2026, 4, 4, 3), utc(2026, 4, 5, 4)))
+        self.assertEqual(end - start, timedelta(hours=25))
+
+    def test_day_when_dst_starts_has_23_hours(self):
+        # 2026-09-06 00:00 -04 salta a 01:00 -03.
+        (start, end), = measurement_lookups({'year': 2026, 'month': 9, 'day': 6})['range']
+        self.assertEqual((start, end), (utc(2026, 9, 6, 4), utc(2026, 9, 7, 3)))
+        self.assertEqual(end - start, timedelta(hours=23))
+
+    def test_hour_range(self):
+        lookups = hour_range(date(2026, 9, 7), 10)
+        self.assertEqual(lookups, {
+            'date_time_medition__gte': utc(2026, 9, 7, 13), 'date_time_medition__lt': utc(2026, 9, 7, 14),
+        })
+
+    def test_same_day_in_a_shorter_month(self):
+        self.assertEqual(same_day_in(2023, 2, 31), date(2023, 2, 28))
+        self.assertEqual(same_day_in(2024, 2, 31), date(2024, 2, 29))
+
+
+class MeasurementDateFilterSetTests(TestCase):
+
+    def setUp(self):
+        self.well = create_well()
+        # Las dos 23:00 del 4 de abril y la medianoche del 5 (-04).
+        for instant in (utc(2026, 4, 5, 2), utc(2026, 4, 5, 3), utc(2026, 4, 5, 4)):
+            InteractionDetail.objects.create(profile_client=self.well, date_time_medition=instant)
+
+    def filter(self, **data):
+        filterset = InteractionDetailViewSet.InteractionFilter(
+            dict(data, profile_client=self.well.id), InteractionDetail.objects.all()
+        )
+        self.assertTrue(filterset.is_valid(), filterset.errors)
+        return sorted(filterset.qs.values_list('date_time_medition', flat=True))
+
+    def test_day_includes_both_repeated_hours(self):
+        self.assertEqual(
+            self.filter(date_time_medition__date='2026-04-04'), [utc(2026, 4, 5, 2), utc(2026, 4, 5, 3)]
+        )
+        self.assertEqual(self.filter(date_time_medition__day=5, date_time_medition__month=4,
+                                     date_time_medition__year=2026), [utc(2026, 4, 5, 4)])
+
+    def test_created_lookups_are_aliases(self):
+        self.assertEqual(
+            self.filter(created__year=2026, created__month=4, created__day=4),
+            self.filter(date_time_medition__date='2026-04-04'),
+        )
+
+    def test_ranges_intersect(self):
+        self.assertEqual(
+            self.filter(date_time_medition__date='2026-04-04', date_time_medition__gte=utc(2026, 4, 5, 3).isoformat()),
+            [utc(2026, 4, 5, 3)],
+        )
+
+    def test_impossible_date_is_a_validation_error(self):
+        with self.assertRaises(ValidationError):
+            self.filter(date_time_medition__year=2026, date_time_medition__month=2, date_time_medition__day=30)
@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+
+from api.crm.models import InteractionDetail
+from api.crm.pagination import KeysetPagination
+
+from .utils import create_well
+
+
+class KeysetPaginationTests(TestCase):
+
+    def setUp(self):
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        # Dos pozos con las mismas horas: el id desempata.
+        for well in (create_well('a@test.cl'), create_well('b@test.cl')):
+            for hours in range(5):
+                InteractionDetail.objects.create(profile_client=well, date_time_medition=hour - timedelta(hours=hours))
+        self.expected = list(
+            InteractionDetail.objects.order_by('-date_time_medition', '-id').values_list('id', flat=True)
+        )
+
+    def page(self, url):
+        paginator = KeysetPagination()
+        rows = paginator.paginate_queryset(InteractionDetail.objects.all(), Request(RequestFactory().get(url)))
+        data = paginator.get_paginated_response([row.id for row in rows]).data
+        return data['results'], data['next'], data['previous'], data.get('count')
+
+    def test_pages_walk_every_row_once(self):
+        ids, url = [], '/readings/?page_size=3'
+        while url:
+            results, url, _, _ = self.page(url)
+            ids.extend(results)
+        self.assertEqual(ids, self.expected)
+
+    def test_previous_link_returns_the_same_page(self):
+        first, next_url, previous, _ = self.page('/readings/?page_size=3')
+        self.assertIsNone(previous)
+        second, _, previous, _ = self.page(next_url)
+        self.assertEqual(second, self.expected[3:6])
+        self.assertEqual(self.page(previous)[0], first)
+
+    def test_count_only_when_asked(self):
+        self.assertIsNone(self.page('/readings/')[3])
+        self.assertEqual(self.page('/readings/?count=true')[3], len(self.expected))
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(NotFound):
+            self.page('/readings/?cursor=no-es-un-cursor')
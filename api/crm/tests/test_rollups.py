@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+
+import pytz
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from api.crm.ingestion.rollups import ROLLUP_FIELDS, apply_readings, rebuild_rollups
+from api.crm.models import InteractionDaily, InteractionDetail, InteractionMonthly, WellSummary
+
+from .utils import TEST_CACHES, create_well
+
+
+def local(*args):
+    return pytz.timezone(settings.TIME_ZONE).localize(datetime(*args))
+
+
+def snapshot(model, period):
+    return {
+        getattr(rollup, period): tuple(getattr(rollup, field) for field in ROLLUP_FIELDS)
+        for rollup in model.objects.all()
+    }
+
+
+class RebuildRollupsTests(TestCase):
+
+    def setUp(self):
+        self.well = create_well()
+        # Dos dias de agosto y uno de septiembre, cada hora sube el totalizador.
+        self.readings = [
+            InteractionDetail.objects.create(
+                profile_client=self.well, date_time_medition=instant,
+                total=1000 + 10 * index, flow=float(index % 5), nivel=2.0,
+            )
+            for index, instant in enumerate(
+                local(2026, 8, 30, 22) + timedelta(hours=hours) for hours in range(30)
+            )
+        ]
+
+    def test_incremental_matches_rebuild(self):
+        first, second = self.readings[:12], self.readings[12:]
+        apply_readings(first)
+        apply_readings(second, previous_totals={self.well.id: first[-1].total})
+        daily, monthly = snapshot(InteractionDaily, 'day'), snapshot(InteractionMonthly, 'month')
+
+        rebuild_rollups(self.well.id)
+        self.assertEqual(snapshot(InteractionDaily, 'day'), daily)
+        self.assertEqual(snapshot(InteractionMonthly, 'month'), monthly)
+
+    def test_volume_carries_the_previous_total(self):
+        rebuild_rollups(self.well.id)
+        days = {rollup.day.isoformat(): rollup for rollup in InteractionDaily.objects.all()}
+        self.assertEqual(days['2026-08-30'].volume, 10)
+        self.assertEqual(days['2026-08-31'].total_start, 1010)
+        self.assertEqual(days['2026-09-01'].volume, 1290 - 1250)
+
+    def test_rebuild_since_keeps_the_earlier_months(self):
+        rebuild_rollups(self.well.id)
+        august = InteractionMonthly.objects.get(month='2026-08-01')
+        InteractionDetail.objects.filter(
+            pk=self.readings[-1].pk, date_time_medition=self.readings[-1].date_time_medition
+        ).update(total=2000)
+
+        rebuild_rollups(self.well.id, since=local(2026, 9, 1).date())
+        self.assertEqual(InteractionMonthly.objects.get(month='2026-08-01').pk, august.pk)
+        september = InteractionMonthly.objects.get(month='2026-09-01')
+        self.assertEqual((september.total_start, september.total_end), (august.total_end, 2000))
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ReadingEditTests(TestCase):
+    """Each edit through the API refreshes the rollups and the summary of its months."""
+
+    def setUp(self):
+        self.well = create_well()
+        self.client = APIClient()
+        self.client.force_authenticate(self.well.user)
+        self.hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+
+    def create(self, minutes, total):
+        response = self.client.post('/api/interaction_detail_json/', {
+            'profile_client': self.well.id, 'total': total, 'flow': 1.0,
+            'date_time_medition': (self.hour + timedelta(minutes=minutes)).isoformat(),
+        }, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        return response.data['id']
+
+    def today(self):
+        return InteractionDaily.objects.get(profile_client=self.well, day=timezone.localdate(self.hour))
+
+    def test_create_update_delete(self):
+        # Misma hora: las dos lecturas caen en el mismo dia.
+        self.create(0, 100)
+        latest = self.create(30, 150)
+        self.assertEqual((self.today().samples, self.today().total_end), (2, 150))
+        self.assertEqual(WellSummary.objects.get(profile_client=self.well).last_total, 150)
+
+        response = self.client.patch('/api/interaction_detail_json/{}/'.format(latest), {'total': 180}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.today().total_end, 180)
+        self.assertEqual(WellSummary.objects.get(profile_client=self.well).last_total, 180)
+
+        self.assertEqual(self.client.delete('/api/interaction_detail_json/{}/'.format(latest)).status_code, 204)
+        self.assertEqual((self.today().samples, self.today().total_end), (1, 100))
+        self.assertEqual(WellSummary.objects.get(profile_client=self.well).last_total, 100)
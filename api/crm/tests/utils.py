@@ -0,0 +1,19 @@
+import tempfile
+
+from api.crm.models import ProfileClient, User
+
+
+# Cache propio: las respuestas cacheadas no se cruzan con las de otra corrida.
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'readings': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': tempfile.mkdtemp(prefix='crm-test-readings-'),
+    },
+    'tokens': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+
+def create_well(email='pozo@test.cl', **fields):
+    user, _ = User.objects.get_or_create(email=email, defaults={'username': email})
+    return ProfileClient.objects.create(user=user, title='Pozo de prueba', **fields)
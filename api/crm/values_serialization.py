@@ -0,0 +1,108 @@
+"""Read-only serialization straight from ``values_list()`` rows."""
+
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.settings import ISO_8601, api_settings
+from django.utils import timezone
+
+from api.crm.serializers.interaction_detail import NumericStringField
+
+
+def identity(value):
+    return value
+
+
+def datetime_converter(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return None
+    field_timezone = getattr(field, 'timezone', field.default_timezone())
+    if field_timezone is None:
+        return None
+
+    def convert(value):
+        if timezone.is_naive(value):
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return convert
+
+
+def related_converter(field):
+    return identity if field.pk_field is None else None
+
+
+# Conversores por clase exacta: una subclase puede cambiar to_representation.
+CONVERTERS = {
+    NumericStringField: lambda field: str,
+    serializers.CharField: lambda field: str,
+    serializers.IntegerField: lambda field: int,
+    serializers.FloatField: lambda field: float,
+    serializers.BooleanField: lambda field: bool,
+    serializers.DateTimeField: datetime_converter,
+    serializers.PrimaryKeyRelatedField: related_converter,
+}
+
+
+class ValuesReader:
+    """Field names, source columns and converters of a serializer."""
+
+    def __init__(self, names, sources, converters):
+        self.names = names
+        self.sources = sources
+        self.converters = converters
+
+    @classmethod
+    def for_serializer(cls, serializer):
+        """The reader of ``serializer``, ``None`` when a field is not supported."""
+        columns = {field.name for field in serializer.Meta.model._meta.concrete_fields}
+        names, sources, converters = [], [], []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            factory = CONVERTERS.get(type(field))
+            converter = factory(field) if factory else None
+            if converter is None or field.source not in columns:
+                return None
+            names.append(name)
+            sources.append(field.source)
+            converters.append(converter)
+        return cls(names, sources, converters)
+
+    def values_list(self, queryset, *required):
+        """``queryset`` as named rows, the sources first and then the ``required`` columns."""
+        return queryset.values_list(*dict.fromkeys([*self.sources, *required]), named=True)
+
+    def data(self, rows):
+        positions = {source: position for position, source in enumerate(dict.fromkeys(self.sources))}
+        fields = [
+            (name, positions[source], None if converter is identity else converter)
+            for name, source, converter in zip(self.names, self.sources, self.converters)
+        ]
+        results = []
+        for row in rows:
+            item = {}
+            for name, position, converter in fields:
+                value = row[position]
+                item[name] = value if value is None or converter is None else converter(value)
+            results.append(item)
+        return results
+
+
+class ValuesListMixin:
+    """``list`` built with ``ValuesReader`` instead of the serializer, plus ``values_required_fields``."""
+
+    values_required_fields = ('id',)
+
+    def list(self, request, *args, **kwargs):
+        reader = ValuesReader.for_serializer(self.get_serializer())
+        if reader is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = reader.values_list(self.filter_queryset(self.get_queryset()), *self.values_required_fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(reader.data(page))
+        return Response(reader.data(queryset))
@@ -1,3 +1,7 @@
 from .users import UserViewSet
 from .client_profile import  ClientProfileViewSet, DataHistoryFactViewSet  
 from .interaction_detail import InteractionDetailViewSet, InteractionXLS
+from .rollups import InteractionDailyViewSet, InteractionMonthlyViewSet
+from .reports import ReportExportViewSet
+from .dashboard import DashboardViewSet
+from .fleet import FleetViewSet
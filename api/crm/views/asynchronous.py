@@ -0,0 +1,105 @@
+"""Async read endpoints (``api/async/``) for the ASGI mode, scoped to the wells of the user."""
+
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework.exceptions import APIException, NotAuthenticated, NotFound, ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.views import exception_handler
+
+from api.crm.authentication import CachedTokenAuthentication
+from api.crm.cache import aget_last_data, aget_many_last_data
+from api.crm.dashboard import awell_dashboard
+from api.crm.models import InteractionDetail, ProfileClient
+from api.crm.models.interaction_detail import LATEST_ORDERING
+from api.crm.pagination import KeysetPagination
+from api.crm.serializers import (
+    InteractionDetailModelSerializer, InteractionDetailSerializer, RetrieveProfileClientSerializer,
+)
+from api.crm.values_serialization import ValuesReader
+
+
+def json_response(data, status=200):
+    return HttpResponse(JSONRenderer().render(data), status=status, content_type='application/json')
+
+
+def async_api_view(view):
+    """Authenticated async view: ``view(request, user)`` returns data, API errors become JSON."""
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        request = Request(request)
+        try:
+            credentials = await CachedTokenAuthentication().aauthenticate(request._request)
+            if credentials is None:
+                raise NotAuthenticated()
+            request.user, request.auth = credentials
+            return json_response(await view(request, *args, **kwargs))
+        except APIException as e:
+            response = exception_handler(e, {'request': request})
+            return json_response(response.data, status=response.status_code)
+    return wrapper
+
+
+async def profile_client_param(request):
+    """Id of ``?profile_client=``, 404 when the well is not the user's."""
+    try:
+        profile_client = int(request.query_params['profile_client'])
+    except (KeyError, ValueError):
+        raise ValidationError({'profile_client': ['Se requiere el id de un pozo.']})
+    if not await ProfileClient.objects.filter(pk=profile_client, user=request.user).aexists():
+        raise NotFound()
+    return profile_client
+
+
+@async_api_view
+async def profile_list(request):
+    """Wells of the user, with ``variables`` and ``last_data`` like ``client_profile/``."""
+    # A diferencia de client_profile/ (abierto, todos los pozos, paginado) pide el token y solo
+    # lista los pozos del usuario, como las otras vistas de este modulo.
+    wells = [
+        well async for well in ProfileClient.objects.filter(user=request.user).select_related('user').prefetch_related(
+            'variable_profile', 'user__groups', 'user__user_permissions'
+        ).order_by('-created')
+    ]
+
+    async def compute(missing):
+        readings = await InteractionDetail.objects.alatest_per_well(missing)
+        latest = {reading.profile_client_id: reading for reading in readings}
+        return {well_id: InteractionDetailSerializer(latest.get(well_id)).data for well_id in missing}
+    last_data = await aget_many_last_data([well.id for well in wells], compute)
+
+    # Todo viene precargado: serializar no consulta la base.
+    context = {'request': request, 'last_data': last_data}
+    return RetrieveProfileClientSerializer(wells, many=True, context=context).data
+
+
+@async_api_view
+async def latest_reading(request):
+    """Latest reading of ``?profile_client=``, from the cache when possible."""
+    profile_client = await profile_client_param(request)
+
+    async def compute():
+        readings = InteractionDetail.objects.filter(profile_client=profile_client).order_by(*LATEST_ORDERING)
+        reading = await readings.recent().afirst() or await readings.afirst()
+        return InteractionDetailSerializer(reading).data
+    return await aget_last_data(profile_client, compute)
+
+
+@async_api_view
+async def interaction_detail(request):
+    """Keyset page of the readings of ``?profile_client=`` (``cursor``, ``page_size``, ``fields``)."""
+    queryset = InteractionDetail.objects.filter(profile_client=await profile_client_param(request))
+    paginator = KeysetPagination()
+    paginator.count = await sync_to_async(paginator.get_count)(queryset, request)
+    reader = ValuesReader.for_serializer(InteractionDetailModelSerializer(context={'request': request}))
+    rows = reader.values_list(paginator.page_queryset(queryset, request), 'id', 'date_time_medition')
+    page = paginator.set_page([row async for row in rows])
+    return paginator.get_paginated_data(reader.data(page))
+
+
+@async_api_view
+async def dashboard(request):
+    return await awell_dashboard(ProfileClient.objects.filter(user=request.user).order_by('title', 'id'))
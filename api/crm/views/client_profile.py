@@ -19,6 +19,9 @@ from api.crm.models import (
     InteractionDetail as Interaction,
 )
 
+from api.crm.cache import cached_payload
+from api.crm.conditional import ConditionalResponseMixin, make_etag
+from api.crm.sparse_fields import SparseFieldsViewMixin
 from api.crm.serializers.client_profile import (
     ProfileClientSerializer,
     RegisterPersons,
@@ -29,7 +32,7 @@ from api.crm.serializers.client_profile import (
 
 
 class ClientProfileViewSet(
-    mixins.RetrieveModelMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+    ConditionalResponseMixin, SparseFieldsViewMixin, mixins.RetrieveModelMixin, mixins.ListModelMixin, viewsets.GenericViewSet
 ):
     def get_permissions(self):
         if self.action in ["list", "retrieve"]:
@@ -61,6 +64,23 @@ class ClientProfileViewSet(
         else:
             return ProfileClientSerializer
 
+    def cached_response(self, request, compute):
+        entry = cached_payload(request, compute)
+        etag = make_etag(entry['etag'], request.accepted_renderer.format)
+        return self.conditional_response(
+            request, etag, entry['last_modified'], lambda: Response(entry['data'])
+        )
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(
+            request, lambda: super(ClientProfileViewSet, self).list(request, *args, **kwargs).data
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(
+            request, lambda: super(ClientProfileViewSet, self).retrieve(request, *args, **kwargs).data
+        )
+
 
 class DataHistoryFactViewSet(
     viewsets.GenericViewSet, mixins.ListModelMixin, mixins.CreateModelMixin
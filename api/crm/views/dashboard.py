@@ -0,0 +1,17 @@
+from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from api.crm.dashboard import well_dashboard
+from api.crm.models import ProfileClient
+
+
+class DashboardViewSet(viewsets.GenericViewSet):
+    """Every well of the user in one response (see ``api.crm.dashboard``)."""
+
+    permission_classes = [IsAuthenticated]
+    queryset = ProfileClient.objects.order_by('title', 'id')
+    pagination_class = None
+
+    def list(self, request):
+        return Response(well_dashboard(self.get_queryset().filter(user=request.user)))
@@ -0,0 +1,32 @@
+from django.db.models import F
+from rest_framework import mixins, viewsets
+from django_filters import rest_framework as filters
+
+from api.crm.models import WellSummary
+from api.crm.pagination import FleetPagination
+from api.crm.permissions import IsAdminView
+from api.crm.serializers import WellSummarySerializer
+
+
+class FleetViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """Every well from the summary table, the least recently read first."""
+
+    permission_classes = [IsAdminView]
+    filter_backends = (filters.DjangoFilterBackend,)
+    queryset = WellSummary.objects.select_related('profile_client__user').order_by(
+        F('last_reading_at').asc(nulls_first=True), 'id'
+    )
+    serializer_class = WellSummarySerializer
+    pagination_class = FleetPagination
+
+    class FleetFilter(filters.FilterSet):
+        class Meta:
+            model = WellSummary
+            fields = {
+                'profile_client__is_dga': ['exact'],
+                'over_granted': ['exact'],
+                'dga_ok': ['exact', 'isnull'],
+                'last_reading_at': ['lte', 'gte', 'isnull'],
+            }
+
+    filterset_class = FleetFilter
@@ -1,13 +1,29 @@
 from rest_framework.viewsets import ReadOnlyModelViewSet
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 from drf_excel.mixins import XLSXFileMixin
 from drf_excel.renderers import XLSXRenderer
 
-from api.crm.serializers import InteractionDetailModelSerializer 
+from api.crm.aggregates import aggregate_readings
+from api.crm.columnar import ColumnarListMixin, to_columns, wants_columns
+from api.crm.conditional import ConditionalQuerysetMixin
+from api.crm.downsampling import DownsampleListMixin, downsample_rows
+from api.crm.exports import INTERACTION_IGNORE_HEADERS, INTERACTION_TITLES, StreamingXLSXMixin
+from api.crm.filters import LEGACY_LOOKUPS, MEASUREMENT_LOOKUPS, MeasurementDateFilterSet
+from api.crm.ingestion.bulk import BulkUpsert, reading_months, refresh_periods
+from api.crm.serializers import InteractionDetailModelSerializer, ReadingAggregateSerializer
 from api.crm.models import InteractionDetail
+from api.crm.pagination import InteractionPagination
+from api.crm.parsers import CSVParser, StreamJSONParser
+from api.crm.renderers import reading_renderers
+from api.crm.sparse_fields import SparseFieldsViewMixin
+from api.crm.values_serialization import ValuesListMixin
+from django.db import transaction
+from django.utils import timezone
 from django_filters import rest_framework as filters
 from rest_framework import mixins, viewsets, status
 
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import ( 
     AllowAny,
     IsAuthenticated
@@ -16,10 +32,75 @@ from rest_framework.permissions import (
 
 
 
-class OverridePagination(PageNumberPagination):       
-               page_size = 10000
-
-class InteractionDetailViewSet(mixins.CreateModelMixin,
+class AggregateMixin:
+    """Adds ``aggregate/``: bucketed sums, averages and deltas of one well."""
+
+    @action(detail=False, methods=['get'], renderer_classes=reading_renderers(),
+            pagination_class=None, filter_backends=[])
+    def aggregate(self, request):
+        serializer = ReadingAggregateSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        results = aggregate_readings(
+            params['profile_client'], params['bucket'],
+            params['start'], params['end'], params['metrics']
+        )
+        if params.get('max_points'):
+            results = downsample_rows(
+                results, 'period', params['metrics'], params['max_points'], params['downsample'],
+                get=lambda row, name: row[name],
+            )
+        if wants_columns(request):
+            results = to_columns(results, ['period', *params['metrics']], get=lambda row, name: row[name])
+        data = {
+            'profile_client': params['profile_client'],
+            'bucket': params['bucket'],
+            'start': params['start'],
+            'end': params['end'],
+            'metrics': params['metrics'],
+            'results': results,
+        }
+        return Response(data)
+
+
+class BulkCreateMixin:
+    """Adds ``bulk/``: upsert of a list of readings (JSON or CSV) with per-row errors."""
+
+    bulk_max_rows = 50000
+    bulk_max_bytes = 20 * 1024 * 1024
+
+    @action(detail=False, methods=['post'], parser_classes=[StreamJSONParser, CSVParser])
+    def bulk(self, request):
+        try:
+            size = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            size = 0
+        if size > self.bulk_max_bytes:
+            raise ValidationError({'readings': ['El envio supera {} bytes.'.format(self.bulk_max_bytes)]})
+
+        rows = request.data
+        if isinstance(rows, dict):
+            rows = rows.get('readings')
+        if not isinstance(rows, list):
+            raise ValidationError({'readings': ['Se requiere una lista de lecturas.']})
+        if len(rows) > self.bulk_max_rows:
+            raise ValidationError({'readings': ['Maximo {} lecturas por envio.'.format(self.bulk_max_rows)]})
+
+        upsert = BulkUpsert(rows)
+        upsert.validate()
+        upsert.save()
+        saved = upsert.created or upsert.updated
+        return Response(upsert.data, status=status.HTTP_200_OK if saved or not rows else status.HTTP_400_BAD_REQUEST)
+
+
+class InteractionDetailViewSet(AggregateMixin,
+                            BulkCreateMixin,
+                            ConditionalQuerysetMixin,
+                            DownsampleListMixin,
+                            SparseFieldsViewMixin,
+                            ColumnarListMixin,
+                            ValuesListMixin,
+                            mixins.CreateModelMixin,
                             mixins.RetrieveModelMixin,
                             mixins.UpdateModelMixin,
                             mixins.ListModelMixin,
@@ -31,45 +112,64 @@ class InteractionDetailViewSet(mixins.CreateModelMixin,
     ordering = ('created', )
     queryset = InteractionDetail.objects.all()
     serializer_class = InteractionDetailModelSerializer
+    pagination_class = InteractionPagination
+    renderer_classes = reading_renderers()
+    # Claves de la paginacion por cursor.
+    sparse_required_fields = values_required_fields = ('id', 'date_time_medition')
 
-    class InteractionFilter(filters.FilterSet):
+    class InteractionFilter(MeasurementDateFilterSet):
         class Meta:
             model = InteractionDetail
             fields = {
                 'profile_client': ['exact'],
                 'is_send_dga': ['exact'],
-                'created': ['contains', 'gte', 'lte', 'year', 'month', 'day', 'year__range', 'month__range', 'day__range', 'date__range'],                
+                'date_time_medition': MEASUREMENT_LOOKUPS,
+                'created': LEGACY_LOOKUPS,
             }
 
     filterset_class = InteractionFilter
 
+    # Cada edicion recalcula los agregados, el resumen y los reportes de sus meses.
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+            refresh_periods(reading_months([serializer.instance]))
+
+    def perform_update(self, serializer):
+        months = reading_months([serializer.instance])
+        with transaction.atomic():
+            # modified cambia con cada edicion (ETag / Last-Modified).
+            serializer.save(modified=timezone.now())
+            refresh_periods(months | reading_months([serializer.instance]))
+
+    def perform_destroy(self, instance):
+        months = reading_months([instance])
+        with transaction.atomic():
+            instance.delete()
+            refresh_periods(months)
 
 
-class InteractionXLS(XLSXFileMixin, ReadOnlyModelViewSet):
+
+class InteractionXLS(AggregateMixin, ConditionalQuerysetMixin, StreamingXLSXMixin, XLSXFileMixin, ReadOnlyModelViewSet):
     queryset = InteractionDetail.objects.all()
     serializer_class = InteractionDetailModelSerializer
     renderer_classes = (XLSXRenderer,)
     filename = 'reporte.xlsx'
     filter_backends = (filters.DjangoFilterBackend,)    
-    pagination_class = OverridePagination
 
-    class InteractionFilter(filters.FilterSet):
+    class InteractionFilter(MeasurementDateFilterSet):
         class Meta:
             model = InteractionDetail
             fields = {
-                'profile_client': ['exact'],            
-                'created': ['contains', 'gte', 'lte', 'year', 'month', 'day', 'year__range', 'month__range', 'day__range', 'date__range'],                
+                'profile_client': ['exact'],
+                'date_time_medition': MEASUREMENT_LOOKUPS,
+                'created': LEGACY_LOOKUPS,
             }
 
     filterset_class = InteractionFilter
 
-    xlsx_ignore_headers = ['modified', 'id', 'date_time_medition', 'profile_client']
+    xlsx_ignore_headers = INTERACTION_IGNORE_HEADERS
     column_header = {
-        'titles': [
-            "FECHA",
-            "CAUDAL",
-            "ACUMULADO",
-            "NIVEL"
-        ]
+        'titles': INTERACTION_TITLES
     }
 
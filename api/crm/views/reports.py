@@ -0,0 +1,58 @@
+from django.http import FileResponse
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from django_filters import rest_framework as filters
+
+from api.crm.exports import XLSX_CONTENT_TYPE
+from api.crm.models import ProfileClient, ReportExport
+from api.crm.reports import request_report
+from api.crm.serializers import ReportExportSerializer, ReportRequestSerializer
+
+
+class ReportExportViewSet(mixins.RetrieveModelMixin,
+                          mixins.ListModelMixin,
+                          viewsets.GenericViewSet):
+    """Monthly XLSX reports: the cached file or the job building it."""
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer]
+    filter_backends = (filters.DjangoFilterBackend,)
+    queryset = ReportExport.objects.all()
+    serializer_class = ReportExportSerializer
+
+    class ReportExportFilter(filters.FilterSet):
+        class Meta:
+            model = ReportExport
+            fields = {
+                'profile_client': ['exact'],
+                'month': ['exact', 'gte', 'lte'],
+                'status': ['exact'],
+            }
+
+    filterset_class = ReportExportFilter
+
+    def report_response(self, report):
+        if report.status != ReportExport.DONE or not report.file:
+            return Response(self.get_serializer(report).data, status=status.HTTP_202_ACCEPTED)
+        filename = '{}-{}.xlsx'.format(report.profile_client.title or report.profile_client_id,
+                                       report.month.strftime('%Y-%m'))
+        return FileResponse(report.file.open('rb'), as_attachment=True,
+                            filename=filename, content_type=XLSX_CONTENT_TYPE)
+
+    @action(detail=False, methods=['get'])
+    def monthly(self, request):
+        """XLSX of ``profile_client`` for ``year``/``month``, or 202 with the job."""
+        serializer = ReportRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        if not ProfileClient.objects.filter(id=params['profile_client']).exists():
+            return Response({'profile_client': ['Pozo no encontrado.']}, status=status.HTTP_404_NOT_FOUND)
+        report = request_report(params['profile_client'], params['month'])
+        return self.report_response(report)
+
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        return self.report_response(self.get_object())
@@ -0,0 +1,53 @@
+from rest_framework import mixins, viewsets
+from rest_framework.permissions import IsAuthenticated
+from django_filters import rest_framework as filters
+
+from api.crm.downsampling import DownsampleListMixin
+from api.crm.models import InteractionDaily, InteractionMonthly
+from api.crm.serializers import InteractionDailySerializer, InteractionMonthlySerializer
+
+
+class InteractionDailyViewSet(DownsampleListMixin,
+                              mixins.RetrieveModelMixin,
+                              mixins.ListModelMixin,
+                              viewsets.GenericViewSet):
+
+    permission_classes = [IsAuthenticated]
+    filter_backends = (filters.DjangoFilterBackend,)
+    queryset = InteractionDaily.objects.all()
+    serializer_class = InteractionDailySerializer
+    downsample_x = 'day'
+    downsample_y = ('volume', 'flow_min', 'flow_max', 'total_end')
+
+    class InteractionDailyFilter(filters.FilterSet):
+        class Meta:
+            model = InteractionDaily
+            fields = {
+                'profile_client': ['exact'],
+                'day': ['exact', 'gte', 'lte', 'year', 'month', 'range'],
+            }
+
+    filterset_class = InteractionDailyFilter
+
+
+class InteractionMonthlyViewSet(DownsampleListMixin,
+                                mixins.RetrieveModelMixin,
+                                mixins.ListModelMixin,
+                                viewsets.GenericViewSet):
+
+    permission_classes = [IsAuthenticated]
+    filter_backends = (filters.DjangoFilterBackend,)
+    queryset = InteractionMonthly.objects.all()
+    serializer_class = InteractionMonthlySerializer
+    downsample_x = 'month'
+    downsample_y = ('volume', 'flow_min', 'flow_max', 'total_end')
+
+    class InteractionMonthlyFilter(filters.FilterSet):
+        class Meta:
+            model = InteractionMonthly
+            fields = {
+                'profile_client': ['exact'],
+                'month': ['exact', 'gte', 'lte', 'year', 'range'],
+            }
+
+    filterset_class = InteractionMonthlyFilter
@@ -61,6 +61,14 @@ class UserViewSet(mixins.RetrieveModelMixin,
         return Response(data, status=status.HTTP_201_CREATED)
 
 
+    @action(detail=False, methods=['post'])
+    def logout(self, request):
+        """Revoke the token of the request."""
+        if request.auth is not None:
+            request.auth.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
     @action(detail=False, methods=['post'])
     def signup(self, request):
         serializer = UserSignUpSerializer(data=request.data)
@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -54,8 +55,63 @@ CRONJOBS = [
     ('27 13 1 * *', 'api.crm.cronjobs_dga.cron_dgamenor.main',  '>> ' + os.path.join(BASE_DIR,'api/log/debug_crondgamedio.log' + ' 2>&1 ')),
     # estandar caudales muy pequenos
     ('40 14 1 12 *', 'api.crm.cronjobs_dga.cron_dgamuypequenos.main',  '>> ' + os.path.join(BASE_DIR,'api/log/debug_crondgamedio.log' + ' 2>&1 ')),
+    # particiones mensuales de interaction detail
+    ('30 3 20 * *', 'api.crm.partitions.main',  '>> ' + os.path.join(BASE_DIR,'api/log/debug_partitions.log' + ' 2>&1 ')),
+    # reportes xlsx mensuales pendientes
+    ('* * * * *', 'api.crm.reports.main',  '>> ' + os.path.join(BASE_DIR,'api/log/debug_reports.log' + ' 2>&1 ')),
 ]
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'stack-dev-sh',
+    },
+    # Cache de ultimas lecturas y respuestas de pozos (api/crm/cache.py).
+    # Compartido entre los cron y los workers: la invalidacion llega a todos.
+    'readings': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(tempfile.gettempdir(), 'stack-dev-sh-readings'),
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+    # Compartido entre los workers: un logout se ve en todos.
+    'tokens': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(tempfile.gettempdir(), 'stack-dev-sh-tokens'),
+    },
+}
+
+READINGS_CACHE = {
+    'ALIAS': 'readings',
+    # Segundos despues de cada ingesta horaria en que expiran las entradas.
+    'GRACE': 120,
+}
+
+TOKEN_CACHE = {
+    'ALIAS': 'tokens',
+    # Segundos que se confia en un token sin volver a la base de datos.
+    'TIMEOUT': 300,
+}
+
+# Ingesta de telemetria (api.crm.cron)
+TELEMETRY_POLLER = {
+    'TIMEOUT': 30,
+    'DEFAULT_HOST_CONCURRENCY': 10,
+    'HOST_CONCURRENCY': {
+        'api.tago.io': 20,
+        'api.thethings.io': 10,
+    },
+}
+
+# Envio de lecturas a la DGA (api.crm.cronjobs_dga)
+DGA_SUBMISSION = {
+    # Envios simultaneos como maximo por corrida.
+    'CONCURRENCY': 8,
+    'CONNECT_TIMEOUT': 10,
+    'READ_TIMEOUT': 60,
+}
+
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
@@ -86,7 +142,7 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_AUTHENTICATION_CLASSES': (
         # 'rest_framework.permissions.AllowAny',
-        'rest_framework.authentication.TokenAuthentication',
+        'api.crm.authentication.CachedTokenAuthentication',
         # 'rest_framework.authentication.SessionAuthentication',
 
     ),
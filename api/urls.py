@@ -1,10 +1,17 @@
 from django.contrib import admin
 from django.urls import path, include
 from api.crm import views
+from api.crm.views import asynchronous
 from django.conf import settings
 from django.conf.urls.static import static
 
 urlpatterns = [
     path('admin/', admin.site.urls),                    
     path('api/', include(('api.crm.router', 'api'), namespace='api')),
+    path('api/async/', include(([
+        path('client_profile/', asynchronous.profile_list, name='client_profile'),
+        path('latest/', asynchronous.latest_reading, name='latest'),
+        path('interaction_detail/', asynchronous.interaction_detail, name='interaction_detail'),
+        path('dashboard/', asynchronous.dashboard, name='dashboard'),
+    ], 'async'), namespace='async')),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT) 
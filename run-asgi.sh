@@ -0,0 +1,7 @@
+#!/bin/bash
+
+python manage.py migrate
+python manage.py collectstatic --noinput
+
+# Modo ASGI (api/async/): uvicorn detras de nginx con conf/nginx-asgi.conf.
+uvicorn api.asgi:application --uds /code/app-asgi.sock --workers 5